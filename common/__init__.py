@@ -0,0 +1 @@
+"""Modules shared by the games, imported as common.<module> with the repository root on the path"""
@@ -0,0 +1,89 @@
+"""Checks that compiled networks give the same outputs as neat.nn.FeedForwardNetwork
+
+    python -m common.check
+    python -m common.check --genomes 50 --seed 3
+
+Networks come from the Pong and Flappy configs, mutated so they have hidden nodes and disabled connections. Outputs are
+compared for equality, except for a NetworkStack made with exact=False, which may differ in the last bits.
+"""
+
+import os
+import random
+import argparse
+
+import neat
+import numpy as np
+
+from .compiled_net import CompiledNetwork, NetworkStack
+
+GAMES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def evolved_genomes(neat_config: neat.Config, count: int, seed: int = 0) -> list[neat.genome.DefaultGenome]:
+    """Genomes of a new population mutated a random number of times each, so their networks differ in shape"""
+    random.seed(seed)
+    genomes = list(neat.Population(neat_config).population.values())[:count]
+    for genome in genomes:
+        for _ in range(random.randrange(30)):
+            genome.mutate(neat_config.genome_config)
+    return genomes
+
+
+def check_networks(genomes: list[neat.genome.DefaultGenome], neat_config: neat.Config, inputs: np.ndarray) -> bool:
+    """Whether activate and activate_batch of every CompiledNetwork match FeedForwardNetwork.activate on all inputs"""
+    for genome in genomes:
+        reference = neat.nn.FeedForwardNetwork.create(genome, neat_config)
+        network = CompiledNetwork.create(genome, neat_config)
+        expected = [reference.activate(row) for row in inputs.tolist()]
+        if [network.activate(row) for row in inputs.tolist()] != expected:
+            return False
+        if network.activate_batch(inputs).tolist() != expected:
+            return False
+    return True
+
+
+def check_stack(genomes: list[neat.genome.DefaultGenome], neat_config: neat.Config, inputs: np.ndarray, seed: int = 0, exact: bool = True) -> bool:
+    """Whether a NetworkStack and random subsets of it match each genome's FeedForwardNetwork on its own input row"""
+    references = [neat.nn.FeedForwardNetwork.create(genome, neat_config) for genome in genomes]
+    stack = NetworkStack([CompiledNetwork.create(genome, neat_config) for genome in genomes], exact=exact)
+    rng = np.random.default_rng(seed)
+
+    for row_inputs in inputs:
+        rows = np.sort(rng.choice(len(genomes), size=rng.integers(1, len(genomes) + 1), replace=False))
+        for members, network in ((np.arange(len(genomes)), stack), (rows, stack.subset(rows))):
+            stack_inputs = row_inputs + rng.normal(0, 5, size=(len(members), len(row_inputs)))
+            expected = [references[member].activate(row) for member, row in zip(members.tolist(), stack_inputs.tolist())]
+            outputs = network.activate(stack_inputs)
+            if exact and outputs.tolist() != expected:
+                return False
+            if not exact and not np.allclose(outputs, expected, rtol=1e-12, atol=1e-12):
+                return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare compiled NEAT networks to neat.nn.FeedForwardNetwork")
+    parser.add_argument("--genomes", type=int, default=30)
+    parser.add_argument("--inputs", type=int, default=20, help="input rows each network is activated on")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    checks = {}
+    for game in ("pong", "flappy"):
+        config_path = os.path.join(GAMES_DIR, game, "config.txt")
+        neat_config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction, neat.DefaultSpeciesSet, neat.DefaultStagnation, config_path)
+        genomes = evolved_genomes(neat_config, args.genomes, args.seed)
+        inputs = np.random.default_rng(args.seed).normal(0, 200, size=(args.inputs, neat_config.genome_config.num_inputs))
+        checks[f"{game} CompiledNetwork"] = lambda genomes=genomes, neat_config=neat_config, inputs=inputs: check_networks(genomes, neat_config, inputs)
+        checks[f"{game} NetworkStack"] = lambda genomes=genomes, neat_config=neat_config, inputs=inputs: check_stack(genomes, neat_config, inputs, args.seed)
+        checks[f"{game} NetworkStack(exact=False)"] = lambda genomes=genomes, neat_config=neat_config, inputs=inputs: check_stack(genomes, neat_config, inputs, args.seed, exact=False)
+
+    failed = [name for name, check in checks.items() if not check()]
+    for name in failed:
+        print(f"{name} differs from FeedForwardNetwork")
+    print(f"{len(checks) - len(failed)} of {len(checks)} checks passed")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Compiled NEAT feed-forward networks
+
+neat.nn.FeedForwardNetwork.activate walks the node graph through dictionaries on every call. A CompiledNetwork turns
+the same node evaluations into generated Python code for single calls and into NumPy column operations for a batch of
+inputs, and a NetworkStack evaluates many different networks side by side with one input row each. Outputs equal
+activate's, unless a NetworkStack is made with exact=False (python -m common.check).
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import neat
+from neat import activations, aggregations
+
+
+# activations that NumPy computes exactly like the scalar functions, all others are applied element by element
+_VECTORIZED_ACTIVATIONS = {
+    activations.relu_activation: lambda z: np.where(z > 0.0, z, 0.0),
+    activations.identity_activation: lambda z: z,
+    activations.clamped_activation: lambda z: np.maximum(-1.0, np.minimum(1.0, z)),
+    activations.abs_activation: np.abs,
+    activations.hat_activation: lambda z: np.maximum(0.0, 1 - np.abs(z)),
+}
+
+# activations whose NumPy functions round differently from math's in the last bit, for stacks made with exact=False
+_APPROXIMATE_ACTIVATIONS = {
+    activations.tanh_activation: lambda z: np.tanh(np.clip(2.5 * z, -60.0, 60.0)),
+    activations.sigmoid_activation: lambda z: 1.0 / (1.0 + np.exp(-np.clip(5.0 * z, -60.0, 60.0))),
+}
+
+
+class CompiledNetwork:
+    """Drop-in replacement for neat.nn.FeedForwardNetwork, with activate_batch for many inputs at once"""
+
+    def __init__(self, input_keys: list[int], output_keys: list[int], node_evals: list[tuple]):
+        self.num_inputs = len(input_keys)
+        self.num_outputs = len(output_keys)
+
+        # value slots: inputs first, then outputs (which stay 0.0 when nothing feeds them), then hidden nodes
+        self.slots = {key: slot for slot, key in enumerate(list(input_keys) + list(output_keys))}
+        for node, *_ in node_evals:
+            self.slots.setdefault(node, len(self.slots))
+        self.output_slots = [self.slots[key] for key in output_keys]
+        self.steps = [
+            (self.slots[node], activation, aggregation, bias, response, [(self.slots[key], weight) for key, weight in links])
+            for node, activation, aggregation, bias, response, links in node_evals
+        ]
+
+        self.activate = self._generate_activate()
+        self._activate_columns = self._generate_activate(columns=True)
+
+    @staticmethod
+    def create(genome: neat.genome.DefaultGenome, neat_config: neat.Config) -> "CompiledNetwork":
+        net = neat.nn.FeedForwardNetwork.create(genome, neat_config)
+        return CompiledNetwork(net.input_nodes, net.output_nodes, net.node_evals)
+
+    @property
+    def num_slots(self) -> int:
+        return len(self.slots)
+
+    def activate_batch(self, inputs: np.ndarray) -> np.ndarray:
+        """Outputs for a (n, num_inputs) array of inputs as a (n, num_outputs) array"""
+        outputs = np.empty((len(inputs), self.num_outputs))
+        # the code of activate run on whole columns, nodes that nothing feeds come out as scalars and are broadcast
+        for column, values in enumerate(self._activate_columns(inputs.T)):
+            outputs[:, column] = values
+        return outputs
+
+    def _generate_activate(self, columns: bool = False):
+        # one line of straight Python per node, constants inlined with repr so they round trip exactly; with columns
+        # every value is a NumPy column of the batch and the functions are applied element by element
+        namespace = {}
+        lines = ["def activate(inputs):"]
+        lines.append(f"    {''.join(f'v{slot}, ' for slot in range(self.num_inputs))}= inputs")
+        lines.extend(f"    v{slot} = 0.0" for slot in self.output_slots)
+
+        for n, (slot, activation, aggregation, bias, response, links) in enumerate(self.steps):
+            namespace[f"activation{n}"] = _vectorize(activation) if columns else activation
+            products = [f"v{source} * {weight!r}" for source, weight in links]
+            if aggregation is aggregations.sum_aggregation:
+                total = " + ".join(products) or "0"
+            else:
+                namespace[f"aggregation{n}"] = _by_row(aggregation) if columns else aggregation
+                total = f"aggregation{n}([{', '.join(products)}])"
+            lines.append(f"    v{slot} = activation{n}({bias!r} + {response!r} * ({total}))")
+
+        lines.append(f"    return [{', '.join(f'v{slot}' for slot in self.output_slots)}]")
+        exec("\n".join(lines), namespace)
+        return namespace["activate"]
+
+
+class NetworkStack:
+    """Many compiled networks evaluated at once, row i of the inputs goes through network i
+
+    The networks may all differ in shape. Node evaluation step t of every network runs together, networks with fewer
+    steps or links are padded with steps that write to a scratch slot and links from a slot that is always 0.0. With
+    exact=False tanh and sigmoid are computed by NumPy instead of element by element with math, many times faster.
+    """
+
+    def __init__(self, networks: list[CompiledNetwork], exact: bool = True):
+        if any(aggregation is not aggregations.sum_aggregation for network in networks for _, _, aggregation, *_ in network.steps):
+            raise ValueError("NetworkStack only supports the sum aggregation")
+
+        self.num_networks = len(networks)
+        self.num_inputs = networks[0].num_inputs if networks else 0
+        self.output_slots = networks[0].output_slots if networks else []
+        self.zero_slot = max((network.num_slots for network in networks), default=0)
+        self.scratch_slot = self.zero_slot + 1
+        self.steps = []
+
+        for step in range(max((len(network.steps) for network in networks), default=0)):
+            num_links = max(len(network.steps[step][5]) for network in networks if step < len(network.steps))
+            targets = np.full(self.num_networks, self.scratch_slot)
+            bias = np.zeros(self.num_networks)
+            response = np.zeros(self.num_networks)
+            sources = np.full((self.num_networks, num_links), self.zero_slot)
+            weights = np.zeros((self.num_networks, num_links))
+            groups: dict = {}
+
+            for row, network in enumerate(networks):
+                if step >= len(network.steps):
+                    continue
+                slot, activation, _, bias[row], response[row], links = network.steps[step]
+                targets[row] = slot
+                for n, (source, weight) in enumerate(links):
+                    sources[row, n] = source
+                    weights[row, n] = weight
+                groups.setdefault(activation, []).append(row)
+
+            activation_rows = [(_vectorize(activation, exact), np.array(rows)) for activation, rows in groups.items()]
+            self.steps.append((targets, bias, response, sources, weights, activation_rows))
+
+    def activate(self, inputs: np.ndarray) -> np.ndarray:
+        """Outputs for a (num_networks, num_inputs) array of inputs as a (num_networks, num_outputs) array"""
+        values = np.zeros((self.num_networks, self.scratch_slot + 1))
+        values[:, : self.num_inputs] = inputs
+        rows = np.arange(self.num_networks)
+
+        for targets, bias, response, sources, weights, activation_rows in self.steps:
+            if sources.shape[1]:
+                # accumulate adds the products left to right, one after another, like activate's running sum from 0.0
+                products = values[rows[:, None], sources] * weights
+                products[:, 0] += 0.0
+                total = np.add.accumulate(products, axis=1)[:, -1]
+            else:
+                total = np.zeros(self.num_networks)
+            z = bias + response * total
+            for activation, group in activation_rows:
+                values[group, targets[group]] = activation(z[group])
+
+        return values[:, self.output_slots]
+
+    def subset(self, rows: np.ndarray) -> "NetworkStack":
+        """Stack of only the networks in rows, in that order, without compiling them again
+
+        Steps and trailing links that are padding for all of the remaining networks are dropped.
+        """
+        new_rows = np.full(self.num_networks, -1)
+        new_rows[rows] = np.arange(len(rows))
+
+        stack = object.__new__(NetworkStack)
+        stack.num_networks = len(rows)
+        stack.num_inputs = self.num_inputs
+        stack.output_slots = self.output_slots
+        stack.zero_slot = self.zero_slot
+        stack.scratch_slot = self.scratch_slot
+        stack.steps = []
+        for targets, bias, response, sources, weights, activation_rows in self.steps:
+            activation_rows = [(activation, new_rows[group][new_rows[group] >= 0]) for activation, group in activation_rows]
+            activation_rows = [(activation, group) for activation, group in activation_rows if len(group)]
+            if not activation_rows:
+                continue
+            sources = sources[rows]
+            used = np.flatnonzero((sources != self.zero_slot).any(axis=0))
+            num_links = used[-1] + 1 if len(used) else 0
+            stack.steps.append((targets[rows], bias[rows], response[rows], sources[:, :num_links], weights[rows, :num_links], activation_rows))
+        return stack
+
+
+def _by_row(aggregation):
+    # the products of a node are columns, or scalars when they come from a node that nothing feeds
+    return lambda products: np.array([aggregation(list(row)) for row in zip(*np.broadcast_arrays(*products))]) if products else aggregation([])
+
+
+@lru_cache(maxsize=None)
+def _vectorize(activation, exact: bool = True):
+    vectorized = _VECTORIZED_ACTIVATIONS.get(activation) or (None if exact else _APPROXIMATE_ACTIVATIONS.get(activation))
+    if vectorized is None:
+        elementwise = np.frompyfunc(activation, 1, 1)
+        vectorized = lambda z: elementwise(z).astype(np.float64)  # noqa: E731
+    return vectorized
@@ -0,0 +1,24 @@
+"""Cached fonts and rendered text
+
+pygame.font.SysFont looks the font up on the system every time it's called and most text on screen doesn't change
+between frames, so both the fonts and the rendered text surfaces are kept. The surfaces are shared, blit them but don't
+draw on them.
+"""
+
+from functools import lru_cache
+
+import pygame
+
+
+MAX_CACHED_TEXTS = 256
+
+
+@lru_cache(maxsize=None)
+def get_font(name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    return pygame.font.SysFont(name, size, bold=bold)
+
+
+@lru_cache(maxsize=MAX_CACHED_TEXTS)
+def render_text(text: str, name: str, size: int, color: tuple[int, int, int], bold: bool = False) -> pygame.Surface:
+    """Antialiased text in the given system font, the least recently used surfaces are dropped first"""
+    return get_font(name, size, bold).render(text, True, color)
@@ -1,27 +1,35 @@
+import os
 import sys
 import pygame
 
+try:
+    from common.text_cache import render_text
+except ImportError:  # run as a script, only the game's own directory is on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.text_cache import render_text
+
 try:
     from .ai import run_neat, eval_genomes
     from .game_objects import Bird, Pipe, Base, BackGround
     from .constants import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, GREEN, GREY
+    from .assets import preload
 except ImportError:
     from ai import run_neat, eval_genomes
     from game_objects import Bird, Pipe, Base, BackGround
     from constants import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, GREEN, GREY
+    from assets import preload
 
 
 def main():
     pygame.display.set_caption("Flappy")
     pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     screen = pygame.display.get_surface()
+    print(f"Loaded images in {preload() * 1000:.1f} ms")
     display_menu(screen)
 
 
 def display_menu(screen: pygame.Surface):
     clock = pygame.time.Clock()
-    font_50 = pygame.font.SysFont("arial", 50)
-    font_40 = pygame.font.SysFont("arial", 40)
 
     while True:
         clock.tick(30)
@@ -39,9 +47,9 @@ def display_menu(screen: pygame.Surface):
 
         screen.fill(BLACK)
 
-        title = font_50.render("Flappy", True, GREEN)
-        human_text = font_40.render("Press H for Human Player", True, GREY)
-        ai_text = font_40.render("Press A for AI Player", True, GREY)
+        title = render_text("Flappy", "arial", 50, GREEN)
+        human_text = render_text("Press H for Human Player", "arial", 40, GREY)
+        ai_text = render_text("Press A for AI Player", "arial", 40, GREY)
 
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3))
         human_rect = human_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
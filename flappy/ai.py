@@ -4,17 +4,34 @@ import pickle
 
 import neat
 import pygame
+import numpy as np
 
 try:
-    from .game_objects import Bird, Pipe, Base, BackGround
+    from common.compiled_net import CompiledNetwork, NetworkStack
+    from common.text_cache import render_text
+except ImportError:  # run as a script, only the game's own directory is on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.compiled_net import CompiledNetwork, NetworkStack
+    from common.text_cache import render_text
+
+try:
+    from .game_objects import Pipe, Base, BackGround
+    from .flock import Flock
+    from .assets import preload
     from .constants import WINDOW_WIDTH, WINDOW_HEIGHT, LOCAL_DIR, BEST_PICKLE
 except ImportError:
-    from game_objects import Bird, Pipe, Base, BackGround
+    from game_objects import Pipe, Base, BackGround
+    from flock import Flock
+    from assets import preload
     from constants import WINDOW_WIDTH, WINDOW_HEIGHT, LOCAL_DIR, BEST_PICKLE
 
 
 FLOOR = 730
 DRAW_LINES = False
+RENDER_EVERY = 10  # generations between the ones shown in a window at 30 frames/sec, 0 to train headless throughout
+MAX_SCORE = 200  # ends a generation whose best birds would otherwise fly on forever without a window to close
+PUMP_EVERY = 30  # frames of a headless generation between handling the events of a window an earlier one left open
+
 
 gen = 0
 
@@ -28,54 +45,71 @@ def eval_genomes(genomes, config):
     global gen
     gen += 1
 
-    win = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-
-    # start by creating lists holding the genome itself, the
-    # neural network associated with the genome and the
-    # bird object that uses that network to play
-    nets = []
-    birds = []
-    ge = []
-    for _, genome in genomes:
-        genome.fitness = 0  # start with fitness level of 0
-        net = neat.nn.FeedForwardNetwork.create(genome, config)
-        nets.append(net)
-        birds.append(Bird(230, 350))
-        ge.append(genome)
-
+    # headless generations run the same frames as fast as they can, with no window, frame limiter or drawing
+    render = RENDER_EVERY > 0 and (gen - 1) % RENDER_EVERY == 0
+    win = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT)) if render else None
+    # the window of the last rendered generation stays open, unanswered it would be taken for hung
+    left_open = not render and pygame.display.get_surface() is not None
+
+    # bird i of the flock is alive while alive[i] is set and plays with the network in the row of the stack where
+    # stacked has i, the fitness is summed up in an array and handed to the genomes at the end
+    # np.tanh may round the last bit differently from neat's math.tanh, which only changes a jump when an output lands
+    # within that bit of 0.5, applying math.tanh bird by bird would take most of the frame for a large flock
+    nets = NetworkStack([CompiledNetwork.create(genome, config) for _, genome in genomes], exact=False)
+    flock = Flock(len(genomes), 230, 350)
+    alive = np.ones(flock.size, dtype=bool)
+    stacked = np.arange(flock.size)
+    fitness = np.zeros(flock.size)
+
+    background = BackGround()
     base = Base(FLOOR)
     pipes = [Pipe(700)]
     score = 0
 
     clock = pygame.time.Clock()
+    frame = 0
 
     run = True
-    while run and len(birds) > 0:
-        clock.tick(30)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    run = False
-                    break
+    while run and alive.any() and score < MAX_SCORE:
+        if render:
+            clock.tick(30)
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        run = False
+                        break
+        elif left_open and frame % PUMP_EVERY == 0:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+        frame += 1
 
         pipe_ind = 0
-        if len(birds) > 0:
-            if len(pipes) > 1 and birds[0].x > pipes[0].x + pipes[0].img_top.get_width():  # determine whether to use the first or second
-                pipe_ind = 1  # pipe on the screen for neural network input
-
-        for x, bird in enumerate(birds):  # give each bird a fitness of 0.1 for each frame it stays alive
-            ge[x].fitness += 0.1
-            bird.move()
-
-            # send bird location, top pipe location and bottom pipe location and determine from network whether to jump or not
-            output = nets[birds.index(bird)].activate((bird.y, abs(bird.y - pipes[pipe_ind].height), abs(bird.y - pipes[pipe_ind].bottom)))
-
-            if output[0] > 0.5:  # we use a tanh activation function so result will be between -1 and 1. if over 0.5 jump
-                bird.jump()
+        if len(pipes) > 1 and flock.x > pipes[0].x + pipes[0].img_top.get_width():  # determine whether to use the first or second
+            pipe_ind = 1  # pipe on the screen for neural network input
+
+        # give each bird a fitness of 0.1 for each frame it stays alive
+        fitness[alive] += 0.1
+        flock.move(alive)
+
+        # once most of the birds in the stack are dead, the networks of the live ones are stacked on their own
+        live = np.flatnonzero(alive)
+        if len(live) * 2 <= len(stacked):
+            nets = nets.subset(np.flatnonzero(alive[stacked]))
+            stacked = live
+
+        # send bird location, top pipe location and bottom pipe location and determine from network whether to jump or not,
+        # all networks are activated at once, rows of dead birds are ignored
+        y = flock.y[stacked]
+        outputs = nets.activate(np.column_stack((y, np.abs(y - pipes[pipe_ind].height), np.abs(y - pipes[pipe_ind].bottom))))
+        jumps = np.zeros(flock.size, dtype=bool)
+        jumps[stacked] = outputs[:, 0] > 0.5  # we use a tanh activation function so result will be between -1 and 1. if over 0.5 jump
+        flock.jump(alive & jumps)
 
         base.move()
 
@@ -84,37 +118,31 @@ def eval_genomes(genomes, config):
         for pipe in pipes:
             pipe.move()
             # check for collision
-            for bird in birds:
-                if pipe.collide(bird):
-                    ge[birds.index(bird)].fitness -= 1
-                    nets.pop(birds.index(bird))
-                    ge.pop(birds.index(bird))
-                    birds.pop(birds.index(bird))
+            hits = flock.collide(pipe, alive)
+            fitness[hits] -= 1
+            alive &= ~hits
 
             if pipe.x + pipe.img_top.get_width() < 0:
                 rem.append(pipe)
 
-            if not pipe.passed and pipe.x < bird.x:
+            if not pipe.passed and pipe.x < flock.x:
                 pipe.passed = True
                 add_pipe = True
 
         if add_pipe:
             score += 1
             # can add this line to give more reward for passing through a pipe (not required)
-            for genome in ge:
-                genome.fitness += 5
+            fitness[alive] += 5
             pipes.append(Pipe(WINDOW_WIDTH))
 
         for r in rem:
             pipes.remove(r)
 
-        for bird in birds:
-            if bird.y + bird.img.get_height() - 10 >= FLOOR or bird.y < -50:
-                nets.pop(birds.index(bird))
-                ge.pop(birds.index(bird))
-                birds.pop(birds.index(bird))
+        alive &= ~flock.out_of_bounds(FLOOR, alive)
 
-        draw_window(win, birds, pipes, base, score, gen, pipe_ind)
+        flock.animate(alive)
+        if render:
+            draw_window(win, background, flock, alive, pipes, base, score, gen, pipe_ind)
 
         # # break if score gets large enough
         # if score > 20:
@@ -122,12 +150,17 @@ def eval_genomes(genomes, config):
         #         pickle.dump(nets[0], f)
         #     break
 
+    for (_, genome), bird_fitness in zip(genomes, fitness.tolist()):
+        genome.fitness = bird_fitness
 
-def draw_window(window, birds, pipes, base, score, generation, pipe_ind):
+
+def draw_window(window, background, flock, alive, pipes, base, score, generation, pipe_ind):
     """
     draws the windows for the main game loop
     :param window: pygame window surface
-    :param birds: a list of Bird objects
+    :param background: the BackGround
+    :param flock: the Flock of all birds
+    :param alive: boolean array of the birds still flying
     :param pipes: List of pipes
     :param score: score of the game (int)
     :param gen: current generation
@@ -137,36 +170,34 @@ def draw_window(window, birds, pipes, base, score, generation, pipe_ind):
     if generation == 0:
         generation = 1
 
-    BackGround().draw(window)
+    background.draw(window)
 
     for pipe in pipes:
         pipe.draw(window)
 
     base.draw(window)
-    for bird in birds:
-        # draw lines from bird to pipe
-        if DRAW_LINES:
+    # draw lines from bird to pipe
+    if DRAW_LINES:
+        for y in flock.y[alive]:
             try:
-                pygame.draw.line(window, (255, 0, 0), (bird.x + bird.img.get_width() / 2, bird.y + bird.img.get_height() / 2), (pipes[pipe_ind].x + pipes[pipe_ind].img_top.get_width() / 2, pipes[pipe_ind].height), 5)
-                pygame.draw.line(window, (255, 0, 0), (bird.x + bird.img.get_width() / 2, bird.y + bird.img.get_height() / 2), (pipes[pipe_ind].x + pipes[pipe_ind].img_bot.get_width() / 2, pipes[pipe_ind].bottom), 5)
+                pygame.draw.line(window, (255, 0, 0), (flock.x + flock.WIDTH / 2, y + flock.HEIGHT / 2), (pipes[pipe_ind].x + pipes[pipe_ind].img_top.get_width() / 2, pipes[pipe_ind].height), 5)
+                pygame.draw.line(window, (255, 0, 0), (flock.x + flock.WIDTH / 2, y + flock.HEIGHT / 2), (pipes[pipe_ind].x + pipes[pipe_ind].img_bot.get_width() / 2, pipes[pipe_ind].bottom), 5)
             except IndexError:
                 pass
 
-        # draw bird
-        bird.draw(window)
-
-    stat_font = pygame.font.SysFont("comicsans", 50)
+    # draw birds
+    flock.draw(window, alive)
 
     # score
-    score_label = stat_font.render("Score: " + str(score), 1, (255, 255, 255))
+    score_label = render_text("Score: " + str(score), "comicsans", 50, (255, 255, 255))
     window.blit(score_label, (WINDOW_WIDTH - score_label.get_width() - 15, 10))
 
     # generations
-    score_label = stat_font.render("Gens: " + str(generation - 1), 1, (255, 255, 255))
+    score_label = render_text("Gens: " + str(generation - 1), "comicsans", 50, (255, 255, 255))
     window.blit(score_label, (10, 10))
 
     # alive
-    score_label = stat_font.render("Alive: " + str(len(birds)), 1, (255, 255, 255))
+    score_label = render_text("Alive: " + str(np.count_nonzero(alive)), "comicsans", 50, (255, 255, 255))
     window.blit(score_label, (10, 50))
 
     pygame.display.update()
@@ -192,5 +223,6 @@ def run_neat(
 
 if __name__ == "__main__":
     pygame.init()
+    print(f"Loaded images in {preload() * 1000:.1f} ms")
     run_neat(eval_genomes, 50)
     pygame.quit()
@@ -0,0 +1,57 @@
+"""Cached sprite images
+
+Every image is read from disk, scaled and converted once for the whole process and then shared by all the objects that
+show it, blit the surfaces but don't draw on them. Converting to the display's pixel format needs a display mode, images
+asked for before one is set are kept as loaded and loaded again, converted, once there is a display.
+"""
+
+import os
+import time
+from functools import lru_cache
+
+import pygame
+
+try:
+    from .constants import LOCAL_DIR
+except ImportError:
+    from constants import LOCAL_DIR
+
+
+IMAGES = {
+    # name: (file, scale2x, size)
+    "bird1": ("bird1.png", True, None),
+    "bird2": ("bird2.png", True, None),
+    "bird3": ("bird3.png", True, None),
+    "pipe": ("pipe.png", True, None),
+    "base": ("base.png", True, None),
+    "background": ("bg.png", False, (600, 900)),
+}
+
+
+def load_image(name: str, flip: bool = False, convert: bool = True) -> pygame.Surface:
+    """Image of IMAGES, upside down with flip, converted to the display's format if convert and a display is set"""
+    return _load_image(name, flip, convert and pygame.display.get_surface() is not None)
+
+
+def preload() -> float:
+    """Load every image for the current display, returns the time that took in seconds"""
+    start = time.perf_counter()
+    for name in IMAGES:
+        load_image(name)
+    load_image("pipe", flip=True)
+    return time.perf_counter() - start
+
+
+@lru_cache(maxsize=None)
+def _load_image(name: str, flip: bool, convert: bool) -> pygame.Surface:
+    filename, double, size = IMAGES[name]
+    image = pygame.image.load(os.path.join(LOCAL_DIR, "imgs", filename))
+    if convert:
+        image = image.convert_alpha()
+    if double:
+        image = pygame.transform.scale2x(image)
+    if size is not None:
+        image = pygame.transform.scale(image, size)
+    if flip:
+        image = pygame.transform.flip(image, False, True)
+    return image
@@ -0,0 +1,112 @@
+"""Checks that a Flock flies its birds like Bird objects
+
+    python -m flappy.check
+    python -m flappy.check --birds 500 --seed 3
+
+Birds of a Flock and Bird objects get the same jumps and pipes, and their state and collisions are compared for
+equality after every frame.
+"""
+
+import random
+import argparse
+
+import numpy as np
+
+try:
+    from .game_objects import Bird, Pipe
+    from .flock import Flock
+    from .ai import FLOOR
+    from .constants import WINDOW_WIDTH
+except ImportError:
+    from game_objects import Bird, Pipe
+    from flock import Flock
+    from ai import FLOOR
+    from constants import WINDOW_WIDTH
+
+
+def bird_out_of_bounds(bird: Bird) -> bool:
+    return bird.y + bird.img.get_height() - 10 >= FLOOR or bird.y < -50
+
+
+def check_flock(num_birds: int, frames: int, seed: int = 0) -> bool:
+    """Whether every bird of a Flock moves, flaps, tilts and crashes like a Bird, frame after frame
+
+    Birds jump when they fall below the middle of the next gap and also at random, each at its own rate, so some fly
+    through many pipes and others hit them or fly off the top.
+    """
+    random.seed(seed)  # pipe heights
+    rng = np.random.default_rng(seed)
+    birds = [Bird(230, 350) for _ in range(num_birds)]
+    flock = Flock(num_birds, 230, 350)
+    alive = np.ones(num_birds, dtype=bool)
+    pipes = [Pipe(700)]
+    jump_rates = rng.uniform(0.0, 0.2, num_birds)  # extra random jumps, which send some birds off the top
+
+    for _ in range(frames):
+        if not alive.any():
+            break
+        for x in np.flatnonzero(alive).tolist():
+            birds[x].move()
+        flock.move(alive)
+
+        pipe = pipes[1] if len(pipes) > 1 and flock.x > pipes[0].x + pipes[0].img_top.get_width() else pipes[0]
+        falling_low = (flock.y > pipe.height + 110) & (flock.tick_count > 5)
+        jumps = alive & (falling_low | (rng.random(num_birds) < jump_rates))
+        for x in np.flatnonzero(jumps).tolist():
+            birds[x].jump()
+        flock.jump(jumps)
+
+        for pipe in pipes:
+            pipe.move()
+            hits = flock.collide(pipe, alive)
+            if [pipe.collide(birds[x]) for x in np.flatnonzero(alive).tolist()] != hits[alive].tolist():
+                return False
+            alive &= ~hits
+        if not pipes[-1].passed and pipes[-1].x < flock.x:
+            pipes[-1].passed = True
+            pipes.append(Pipe(WINDOW_WIDTH))
+        pipes = [pipe for pipe in pipes if pipe.x + pipe.img_top.get_width() >= 0]
+
+        out = flock.out_of_bounds(FLOOR, alive)
+        if [bird_out_of_bounds(birds[x]) for x in np.flatnonzero(alive).tolist()] != out[alive].tolist():
+            return False
+        alive &= ~out
+
+        for x in np.flatnonzero(alive).tolist():
+            birds[x].animate()
+        flock.animate(alive)
+
+        state = [(bird.y, bird.tilt_angle, bird.tick_count, bird.vel, bird.height, bird.img_count, bird.frame) for bird in birds]
+        flock_state = zip(
+            flock.y.tolist(),
+            flock.tilt_angle.tolist(),
+            flock.tick_count.tolist(),
+            flock.vel.tolist(),
+            flock.height.tolist(),
+            flock.img_count.tolist(),
+            flock.frame.tolist(),
+        )
+        if state != list(flock_state):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Flappy's Flock to Bird objects")
+    parser.add_argument("--birds", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    checks = {
+        "Flock": lambda: check_flock(args.birds, args.frames, args.seed),
+    }
+    failed = [name for name, check in checks.items() if not check()]
+    for name in failed:
+        print(f"{name} differs from Bird")
+    print(f"{len(checks) - len(failed)} of {len(checks)} checks passed")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
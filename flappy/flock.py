@@ -0,0 +1,96 @@
+"""A whole population of birds as arrays
+
+A Flock keeps the state of every Bird in NumPy arrays, one element per bird, and moves, flaps and checks all of them
+in one go instead of one Bird object at a time, each like the Bird method of the same name (python -m flappy.check).
+
+Collisions are first checked on bounding boxes, only birds whose image overlaps a pipe image get the pixel-mask check
+of Pipe.collide.
+"""
+
+import numpy as np
+import pygame
+
+try:
+    from .game_objects import Bird, Pipe
+except ImportError:
+    from game_objects import Bird, Pipe
+
+
+class Flock:
+    # the animation frames all have the same size
+    WIDTH, HEIGHT = Bird.IMGS[0].get_size()
+    # frame shown at each img_count of Bird.animate's flap cycle, which runs from 1 to 4 * ANIMATION_TIME + 1
+    FRAMES = np.repeat([0, 0, 1, 2, 1, 0], [1, Bird.ANIMATION_TIME, Bird.ANIMATION_TIME, Bird.ANIMATION_TIME, Bird.ANIMATION_TIME, 1])
+
+    def __init__(self, size: int, x: int, y: int):
+        self.size = size
+        self.x = x  # all birds fly at the same x
+        self.y = np.full(size, y, dtype=np.float64)
+        self.tilt_angle = np.zeros(size, dtype=np.int64)
+        self.tick_count = np.zeros(size, dtype=np.int64)
+        self.vel = np.zeros(size)
+        self.height = self.y.copy()
+        self.img_count = np.zeros(size, dtype=np.int64)
+        self.frame = np.zeros(size, dtype=np.int64)
+
+    def jump(self, birds: np.ndarray):
+        """Bird.jump for the birds selected by a boolean array"""
+        self.vel[birds] = Bird.JUMP_VEL
+        self.tick_count[birds] = 0
+        self.height[birds] = self.y[birds]
+
+    def move(self, birds: np.ndarray):
+        """Bird.move for the birds selected by a boolean array"""
+        self.tick_count[birds] += 1
+        t = self.tick_count
+
+        # for downward acceleration, with terminal velocity
+        displacement = self.vel * t + 0.5 * (3) * t**2
+        displacement = np.where(displacement >= 16, 16.0, displacement)
+        displacement = np.where(displacement < 0, displacement - 2, displacement)
+        np.add(self.y, displacement, out=self.y, where=birds)
+
+        tilt_up = (displacement < 0) | (self.y < self.height + 50)
+        tilt_down = ~tilt_up & (self.tilt_angle > -90)
+        self.tilt_angle[birds & tilt_up] = np.maximum(self.tilt_angle[birds & tilt_up], Bird.MAX_ROTATION)
+        self.tilt_angle[birds & tilt_down] -= Bird.ROT_VEL
+
+    def animate(self, birds: np.ndarray):
+        """Bird.animate for the birds selected by a boolean array"""
+        self.img_count[birds] += 1
+        step = Bird.ANIMATION_TIME
+
+        frame = self.FRAMES[self.img_count]
+        restart = birds & (self.img_count == step * 4 + 1)
+        self.img_count[restart] = 0
+
+        # so when bird is nose diving it isn't flapping
+        diving = birds & (self.tilt_angle <= -80)
+        frame[diving] = 1
+        self.img_count[diving] = step * 2
+        self.frame[birds] = frame[birds]
+
+    def collide(self, pipe: Pipe, birds: np.ndarray) -> np.ndarray:
+        """Boolean array of the birds selected by a boolean array that touch the pipe, like Pipe.collide"""
+        hits = np.zeros(self.size, dtype=bool)
+        if pipe.x >= self.x + self.WIDTH or pipe.x + pipe.img_top.get_width() <= self.x:
+            return hits
+
+        # rows the bird image covers against the rows of the two pipe images, the gap is in between
+        top = np.round(self.y).astype(np.int64)
+        bottom = top + self.HEIGHT
+        near = birds & (((top < pipe.height) & (bottom > pipe.top)) | ((bottom > pipe.bottom) & (top < pipe.bottom + pipe.img_bot.get_height())))
+
+        for x in np.flatnonzero(near):
+            bird_mask = Bird.MASKS[self.frame[x]]
+            y = int(top[x])
+            hits[x] = bool(bird_mask.overlap(Pipe.MASK_BOTTOM, (pipe.x - self.x, pipe.bottom - y)) or bird_mask.overlap(Pipe.MASK_TOP, (pipe.x - self.x, pipe.top - y)))
+        return hits
+
+    def out_of_bounds(self, floor: int, birds: np.ndarray) -> np.ndarray:
+        """Boolean array of the birds selected by a boolean array that hit the floor or flew off the top"""
+        return birds & ((self.y + self.HEIGHT - 10 >= floor) | (self.y < -50))
+
+    def draw(self, window: pygame.Surface, birds: np.ndarray):
+        for x in np.flatnonzero(birds):
+            Bird.ATLAS.blit(window, int(self.frame[x]), (self.x, float(self.y[x])), int(self.tilt_angle[x]))
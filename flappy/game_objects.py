@@ -1,18 +1,20 @@
-import os
+import math
 import random
 import pygame
 
 try:
-    from .constants import LOCAL_DIR
+    from .assets import load_image
 except ImportError:
-    from constants import LOCAL_DIR
+    from assets import load_image
 
 
 class Bird:
-    IMGS = [pygame.transform.scale2x(pygame.image.load(os.path.join(LOCAL_DIR, "imgs", "bird" + str(x) + ".png"))) for x in range(1, 4)]
+    IMGS = [load_image("bird" + str(x), convert=False) for x in range(1, 4)]
+    MASKS = [pygame.mask.from_surface(img) for img in IMGS]
     ROT_VEL = 20
     MAX_ROTATION = 25
     ANIMATION_TIME = 5
+    JUMP_VEL = -10.5
 
     def __init__(self, x: int, y: int):
         self.x = x
@@ -22,10 +24,11 @@ class Bird:
         self.vel = 0
         self.height = self.y
         self.img_count = 0
+        self.frame = 0  # index of img in IMGS
         self.img = self.IMGS[0]
 
     def jump(self):
-        self.vel = -10.5
+        self.vel = self.JUMP_VEL
         self.tick_count = 0
         self.height = self.y
 
@@ -52,31 +55,50 @@ class Bird:
                 self.tilt_angle -= self.ROT_VEL
 
     def draw(self, window: pygame.Surface):
+        self.animate()
+
+        # tilt the bird
+        self.ATLAS.blit(window, self.frame, (self.x, self.y), self.tilt_angle)
+
+    def animate(self):
+        """Advance the wing flap by a frame, done by draw or, when training headless, instead of it"""
         self.img_count += 1
 
         # For animation of bird, loop through three images
         if self.img_count <= self.ANIMATION_TIME:
-            self.img = self.IMGS[0]
+            self.frame = 0
         elif self.img_count <= self.ANIMATION_TIME * 2:
-            self.img = self.IMGS[1]
+            self.frame = 1
         elif self.img_count <= self.ANIMATION_TIME * 3:
-            self.img = self.IMGS[2]
+            self.frame = 2
         elif self.img_count <= self.ANIMATION_TIME * 4:
-            self.img = self.IMGS[1]
+            self.frame = 1
         elif self.img_count == self.ANIMATION_TIME * 4 + 1:
-            self.img = self.IMGS[0]
+            self.frame = 0
             self.img_count = 0
 
         # so when bird is nose diving it isn't flapping
         if self.tilt_angle <= -80:
-            self.img = self.IMGS[1]
+            self.frame = 1
             self.img_count = self.ANIMATION_TIME * 2
 
-        # tilt the bird
-        blitRotateCenter(window, self.img, (self.x, self.y), self.tilt_angle)
+        self.img = self.IMGS[self.frame]
 
     def get_mask(self) -> pygame.mask.Mask:
-        return pygame.mask.from_surface(self.img)
+        return self.MASKS[self.frame]
+
+    @classmethod
+    def tilt_angles(cls) -> list[int]:
+        """Every tilt angle move can give a bird, tilting up to MAX_ROTATION or down by ROT_VEL from the start"""
+        angles, new = set(), [0]
+        while new:
+            angle = new.pop()
+            if angle not in angles:
+                angles.add(angle)
+                new.append(max(angle, cls.MAX_ROTATION))
+                if angle > -90:
+                    new.append(angle - cls.ROT_VEL)
+        return sorted(angles)
 
 
 def blitRotateCenter(surface: pygame.Surface, image: pygame.Surface, topleft: tuple, angle: float):
@@ -92,18 +114,54 @@ def blitRotateCenter(surface: pygame.Surface, image: pygame.Surface, topleft: tu
     surface.blit(rotated_image, new_rect.topleft)
 
 
+class RotationAtlas:
+    """Images rotated once to each of a set of angles, so that drawing one of them rotated is a single blit
+
+    Every entry keeps the rotated image and the offset of its top left from the top left of the unrotated image when
+    both share a center. Angles that aren't in the atlas are rotated when drawn, like blitRotateCenter does.
+    """
+
+    def __init__(self, images: list[pygame.Surface], angles: list[int]):
+        self.images = images
+        self.entries = {}
+        for frame, image in enumerate(images):
+            center = image.get_rect().center
+            for angle in angles:
+                rotated = pygame.transform.rotate(image, angle)
+                offset = rotated.get_rect(center=center).topleft
+                self.entries[frame, angle] = (rotated, offset)
+
+    def blit(self, surface: pygame.Surface, frame: int, topleft: tuple, angle: float):
+        entry = self.entries.get((frame, angle))
+        if entry is None:
+            blitRotateCenter(surface, self.images[frame], topleft, angle)
+            return
+        rotated, (dx, dy) = entry
+        # the top left rounds like it does as a Rect in blitRotateCenter
+        surface.blit(rotated, (_round_half_away(topleft[0]) + dx, _round_half_away(topleft[1]) + dy))
+
+
+Bird.ATLAS = RotationAtlas(Bird.IMGS, Bird.tilt_angles())
+
+
+def _round_half_away(value: float) -> int:
+    return int(math.floor(value + 0.5)) if value >= 0 else int(math.ceil(value - 0.5))
+
+
 class Pipe:
     VEL = 5
     GAP = 200
+    # the masks only depend on the image, which is the same for every pipe
+    MASK_BOTTOM = pygame.mask.from_surface(load_image("pipe", convert=False))
+    MASK_TOP = pygame.mask.from_surface(load_image("pipe", flip=True, convert=False))
 
     def __init__(self, x: int):
-        pipe_img = pygame.transform.scale2x(pygame.image.load(os.path.join(LOCAL_DIR, "imgs", "pipe.png")).convert_alpha())
         self.x = x
         self.top = 0
         self.bottom = 0
         self.height = 0
-        self.img_bot = pipe_img
-        self.img_top = pygame.transform.flip(pipe_img, False, True)
+        self.img_bot = load_image("pipe")
+        self.img_top = load_image("pipe", flip=True)
         self.passed = False
         self.set_height()
 
@@ -121,8 +179,8 @@ class Pipe:
 
     def collide(self, bird: Bird):
         bird_mask = bird.get_mask()
-        top_mask = pygame.mask.from_surface(self.img_top)
-        bottom_mask = pygame.mask.from_surface(self.img_bot)
+        top_mask = self.MASK_TOP
+        bottom_mask = self.MASK_BOTTOM
         top_offset = (self.x - bird.x, self.top - round(bird.y))
         bottom_offset = (self.x - bird.x, self.bottom - round(bird.y))
         b_point = bird_mask.overlap(bottom_mask, bottom_offset)
@@ -136,7 +194,7 @@ class Base:
     VEL = 5
 
     def __init__(self, y: int):
-        self.img = pygame.transform.scale2x(pygame.image.load(os.path.join(LOCAL_DIR, "imgs", "base.png")).convert_alpha())
+        self.img = load_image("base")
         self.width = self.img.get_width()
         self.y = y
         self.x1 = 0
@@ -157,7 +215,7 @@ class Base:
 
 class BackGround:
     def __init__(self):
-        self.img = pygame.transform.scale(pygame.image.load(os.path.join(LOCAL_DIR, "imgs", "bg.png")).convert_alpha(), (600, 900))
+        self.img = load_image("background")
 
     def draw(self, window: pygame.Surface):
         window.blit(self.img, (0, 0))
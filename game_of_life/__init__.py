@@ -0,0 +1,2 @@
+from .__main__ import main
+from .game_logic import update
@@ -0,0 +1,144 @@
+"""🌱 Conway's Game of Life
+
+The universe of the Game of Life is an infinite, two-dimensional orthogonal grid of square cells, each of which is in one of two possible states, live or dead.
+Every cell interacts with its eight neighbors, which are the cells that are horizontally, vertically, or diagonally adjacent.
+
+At each step in time, the following transitions occur:
+1. Any live cell with fewer than two live neighbors dies, as if by under population.
+2. Any live cell with two or three live neighbors lives on to the next generation.
+3. Any live cell with more than three live neighbors dies, as if by overpopulation.
+4. Any dead cell with exactly three live neighbors becomes a live cell, as if by reproduction.
+
+The initial pattern constitutes the seed of the system.
+The first generation is created by applying the above rules simultaneously to every cell in the seed, live or dead; births and deaths occur simultaneously, and the discrete moment at which this happens is sometimes called a tick.
+Each generation is a pure function of the preceding one. The rules continue to be applied repeatedly to create further generations.
+"""
+
+import sys
+import pygame
+import numpy as np
+
+try:
+    from .engines import ENGINES
+    from .packed import PackedBoard
+    from .draw import Viewport, GridRenderer
+    from .patterns import load_pattern, save_snapshot, write_snapshot, read_snapshot, place
+    from .cycles import CycleDetector
+    from .constants import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE, GRID_WIDTH, GRID_HEIGHT, FPS, ENGINE, PATTERN, SNAPSHOT_PATH, MAX_PERIOD, STOP_ON_CYCLE
+except ImportError:
+    from engines import ENGINES
+    from packed import PackedBoard
+    from draw import Viewport, GridRenderer
+    from patterns import load_pattern, save_snapshot, write_snapshot, read_snapshot, place
+    from cycles import CycleDetector
+    from constants import WINDOW_WIDTH, WINDOW_HEIGHT, BLACK, WHITE, GRID_WIDTH, GRID_HEIGHT, FPS, ENGINE, PATTERN, SNAPSHOT_PATH, MAX_PERIOD, STOP_ON_CYCLE
+
+
+def main(engine: str = ENGINE, pattern: str | None = PATTERN):
+    pygame.display.set_caption("Conway's Game of Life")
+
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont("arial", 20)
+
+    board, iteration = load_board(engine, pattern)
+    shape = (board.rows, board.cols) if isinstance(board, PackedBoard) else board.grid.shape
+    viewport = Viewport(shape, (WINDOW_WIDTH, WINDOW_HEIGHT))
+    renderer = GridRenderer()
+    detector = CycleDetector(shape, MAX_PERIOD)
+
+    running = True
+    paused = False
+
+    while running:
+        clock.tick(FPS)
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+                pygame.quit()
+                sys.exit()
+
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key in (pygame.K_SPACE, pygame.K_p):
+                    paused = not paused
+                elif event.key == pygame.K_s:
+                    save_board(SNAPSHOT_PATH, board, iteration)
+                elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    viewport.zoom(1)
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    viewport.zoom(-1)
+                elif event.key == pygame.K_UP:
+                    viewport.pan(-1, 0)
+                elif event.key == pygame.K_DOWN:
+                    viewport.pan(1, 0)
+                elif event.key == pygame.K_LEFT:
+                    viewport.pan(0, -1)
+                elif event.key == pygame.K_RIGHT:
+                    viewport.pan(0, 1)
+
+            elif event.type == pygame.MOUSEWHEEL:
+                viewport.zoom(event.y)
+
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                cell = viewport.to_cell(event.pos)
+                if cell is not None:
+                    board.toggle(*cell)
+                    detector.reset()
+
+        if not paused:
+            board.update()
+            iteration += board.generations_per_update
+            if detector.observe(board.grid, getattr(board, "changed", None)) is not None and STOP_ON_CYCLE:
+                paused = True
+
+        screen.fill(BLACK)
+
+        # Draw live cells
+        renderer.draw(screen, board.grid, viewport)
+
+        # Render labels
+        text_iteration = font.render(f"Iteration: {iteration}", True, WHITE)
+        text_alive = font.render(f"Alive: {board.population}", True, WHITE)
+        screen.blit(text_iteration, (10, 10))
+        screen.blit(text_alive, (10, 35))
+        if detector.period is not None:
+            text_period = font.render(f"Period: {detector.period * board.generations_per_update}", True, WHITE)
+            screen.blit(text_period, (10, 60))
+
+        pygame.display.flip()
+
+
+def load_board(engine: str, pattern: str | None) -> tuple:
+    """Board of the engine seeded from the pattern file or at random, with the generation to count on from
+
+    A snapshot loaded onto the packed board is copied from its memory-mapped words as they are, so a large board resumes
+    without ever being unpacked into a full grid.
+    """
+    if pattern and engine == "packed" and pattern.endswith(".gol"):
+        words, cols, generation = read_snapshot(pattern)
+        return PackedBoard.from_words(words, cols), generation
+
+    generation = 0
+    if pattern:
+        grid, generation = load_pattern(pattern)
+        grid = place(grid, (GRID_HEIGHT, GRID_WIDTH))
+    else:
+        grid = np.random.randint(2, size=(GRID_HEIGHT, GRID_WIDTH))
+    return ENGINES[engine](grid), generation
+
+
+def save_board(path: str, board, generation: int):
+    """Snapshot of the board, the packed board writes its words without unpacking them"""
+    if isinstance(board, PackedBoard):
+        write_snapshot(path, board.words, board.cols, generation)
+    else:
+        save_snapshot(path, board.grid, generation)
+
+
+if __name__ == "__main__":
+    pygame.init()
+    main()
+    pygame.quit()
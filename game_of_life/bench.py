@@ -0,0 +1,151 @@
+"""Headless Game of Life runner
+
+Steps every board implementation in engines.ENGINES through the same seed as fast as it can, without opening a window or
+limiting the frame rate, and reports generations/s, cells/s and peak memory so performance can be compared between
+releases:
+
+    python -m game_of_life.bench --size 1000 --generations 200
+    python -m game_of_life.bench --pattern gun.rle --engines packed hashlife
+
+With --check it instead steps every board alongside the numpy one on boards of odd and non-square sizes and reports
+whether their grids agree.
+"""
+
+import time
+import argparse
+import tracemalloc
+from dataclasses import dataclass
+
+import numpy as np
+
+try:
+    from .engines import ENGINES
+    from .game_logic import Board
+    from .patterns import load_pattern, parse_cells, place
+except ImportError:
+    from engines import ENGINES
+    from game_logic import Board
+    from patterns import load_pattern, parse_cells, place
+
+
+CHECK_SHAPES = [(3, 3), (5, 7), (8, 8), (15, 17), (64, 96), (121, 161), (127, 127)]
+# boards too small for a random soup clear of the edges start from patterns that don't reach them within 20 generations
+CHECK_PATTERNS = {
+    (3, 3): "OOO",  # blinker
+    (5, 7): "O...O\nO...O\nO...O",  # two blinkers
+    (8, 8): ".OOO\nOOO.",  # toad
+    (15, 17): ".O.\n..O\nOOO",  # glider
+}
+
+
+@dataclass
+class BenchmarkResult:
+    engine: str
+    cells: int
+    generations: int
+    seconds: float
+    peak_memory: int  # bytes allocated in this process, worker processes and shared memory are not included
+
+    @property
+    def generations_per_second(self) -> float:
+        return self.generations / self.seconds
+
+    @property
+    def cells_per_second(self) -> float:
+        return self.cells * self.generations / self.seconds
+
+
+def run(engine: str, grid: np.ndarray, generations: int) -> BenchmarkResult:
+    # tracing allocations slows the boards down several times over, so the timed pass runs without it
+    board = ENGINES[engine](grid)
+    board.update()  # warm up, e.g. worker pools and caches
+    done = 0
+    start_time = time.perf_counter()
+    while done < generations:
+        board.update()
+        done += board.generations_per_update
+    seconds = time.perf_counter() - start_time
+    del board
+    return BenchmarkResult(engine, grid.size, done, seconds, peak_memory(engine, grid, generations))
+
+
+def peak_memory(engine: str, grid: np.ndarray, generations: int) -> int:
+    """Peak bytes allocated while building a board and stepping it through the generations, in a separate untimed pass"""
+    tracemalloc.start()
+    try:
+        board = ENGINES[engine](grid)
+        done = 0
+        while done < generations + 1:
+            board.update()
+            done += board.generations_per_update
+        del board
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def check(shape: tuple[int, int], generations: int, engine: str, seed: int = 0) -> bool:
+    """Whether a board of the engine has the same grid as the numpy board at every generation
+
+    The board starts from its CHECK_PATTERNS entry or a random soup kept far enough from the edges that no cell near them
+    changes within the generations, so boards with dead edges and Hashlife's unbounded plane give the same result.
+    """
+    rows, cols = shape
+    margin = generations + 1
+    if shape in CHECK_PATTERNS:
+        grid = place(parse_cells(CHECK_PATTERNS[shape]), shape)
+    else:
+        grid = np.zeros(shape, dtype=np.uint8)
+        grid[margin:-margin, margin:-margin] = np.random.default_rng(seed).integers(2, size=(rows - 2 * margin, cols - 2 * margin))
+
+    expected = Board(grid)
+    board = ENGINES[engine](grid)
+    if not np.array_equal(board.grid, expected.grid):
+        return False
+    done = 0
+    while done < generations:
+        board.update()
+        for _ in range(board.generations_per_update):
+            expected.update()
+        done += board.generations_per_update
+        if not np.array_equal(board.grid, expected.grid):
+            return False
+    return True
+
+
+def run_all(grid: np.ndarray, generations: int, engines: list[str] | None = None) -> list[BenchmarkResult]:
+    return [run(engine, grid, generations) for engine in engines or ENGINES]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Game of Life boards without a window")
+    parser.add_argument("--size", type=int, default=512, help="width and height of the random board")
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random board")
+    parser.add_argument("--pattern", help=".rle, .cells or .gol file to use instead of a random board")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument("--check", action="store_true", help="compare the boards to the numpy one instead of timing them")
+    args = parser.parse_args()
+
+    if args.check:
+        generations = min(args.generations, 20)
+        failed = [(engine, shape) for engine in args.engines for shape in CHECK_SHAPES if not check(shape, generations, engine, args.seed)]
+        for engine, shape in failed:
+            print(f"{engine} differs from numpy on a {shape[1]}x{shape[0]} board")
+        print(f"{len(args.engines) * len(CHECK_SHAPES) - len(failed)} of {len(args.engines) * len(CHECK_SHAPES)} checks passed")
+        raise SystemExit(1 if failed else 0)
+
+    if args.pattern:
+        grid = place(load_pattern(args.pattern)[0], (args.size, args.size))
+    else:
+        grid = np.random.default_rng(args.seed).integers(2, size=(args.size, args.size), dtype=np.uint8)
+
+    print(f"{grid.shape[1]}x{grid.shape[0]} board, {args.generations} generations")
+    print(f"{'engine':<10} {'generations/s':>14} {'cells/s':>14} {'peak memory':>14}")
+    for result in run_all(grid, args.generations, args.engines):
+        print(f"{result.engine:<10} {result.generations_per_second:>14.1f} {result.cells_per_second:>14.3g} {result.peak_memory / 2**20:>11.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
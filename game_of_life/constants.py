@@ -0,0 +1,29 @@
+import os
+
+WINDOW_WIDTH, WINDOW_HEIGHT = 800, 600
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+CELL_SIZE = 5
+GRID_WIDTH = WINDOW_WIDTH // CELL_SIZE
+GRID_HEIGHT = WINDOW_HEIGHT // CELL_SIZE
+FPS = 10
+
+# viewport: pixels per cell (fractions zoom out) and pixels moved per pan key press
+ZOOM_LEVELS = [1 / 8, 1 / 4, 1 / 2, 1, 2, 3, 5, 8, 12, 20]
+PAN_STEP = 50
+
+# board implementation used by main(), see engines.ENGINES
+ENGINE = "numpy"
+
+# rule and edge mode of the numpy board, see rules.RULES and game_logic.EDGE_MODES
+RULE = "B3/S23"
+EDGE = "dead"
+
+# optional .rle, .cells or .gol file to seed main() with instead of a random grid, S saves a snapshot
+LOCAL_DIR = os.path.dirname(__file__)
+PATTERN = None
+SNAPSHOT_PATH = os.path.join(LOCAL_DIR, "snapshot.gol")
+
+# longest oscillator period main() looks for, and whether it pauses once the board cycles
+MAX_PERIOD = 16
+STOP_ON_CYCLE = False
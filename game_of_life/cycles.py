@@ -0,0 +1,98 @@
+from collections import deque
+
+import numpy as np
+
+try:
+    from .constants import MAX_PERIOD
+except ImportError:
+    from constants import MAX_PERIOD
+
+
+class CycleDetector:
+    """Detects when a board returns to a recent state, i.e. it settled into still lifes and oscillators
+
+    Each state is identified by a Zobrist hash: the XOR of a random 64-bit key per live cell. Between generations only the
+    keys of the cells that changed are XORed in or out. Boards that report those cells themselves (SparseBoard.changed)
+    are hashed in time proportional to the changes; for the others the changes are found by comparing the whole grid with
+    the previous one.
+    """
+
+    def __init__(self, shape: tuple[int, int], max_period: int = MAX_PERIOD, seed: int = 0):
+        self.max_period = max_period
+        self.keys = np.random.default_rng(seed).integers(0, 2**64, size=shape, dtype=np.uint64, endpoint=False)
+        self.history: deque[int] = deque(maxlen=max_period)
+        self.hash: int | None = None
+        self.period: int | None = None
+        self._previous: np.ndarray | None = None
+
+    def reset(self):
+        # forget the history, e.g. after cells were edited by hand
+        self.history.clear()
+        self.hash = None
+        self.period = None
+        self._previous = None
+
+    def observe(self, grid: np.ndarray, changed: tuple[np.ndarray, np.ndarray] | None = None) -> int | None:
+        """Record the next generation, returning its period if it repeats one of the last max_period generations
+
+        changed holds the row and column indices of the cells that flipped since the previous generation, when known.
+        """
+        if changed is not None and self.hash is not None:
+            self.hash ^= int(np.bitwise_xor.reduce(self.keys[changed]))
+            self._previous = None  # not kept up to date, a later call without changed starts from the grid again
+        else:
+            live = grid != 0
+            if self._previous is None:
+                self.hash = int(np.bitwise_xor.reduce(self.keys[live]))
+            else:
+                self.hash ^= int(np.bitwise_xor.reduce(self.keys[live != self._previous]))
+            self._previous = live
+
+        self.period = None
+        for distance, previous_hash in enumerate(reversed(self.history), start=1):
+            if previous_hash == self.hash:
+                self.period = distance
+                break
+        self.history.append(self.hash)
+        return self.period
+
+
+def run(board, generations: int, max_period: int = MAX_PERIOD, fast_forward: bool = True) -> tuple[int, int | None]:
+    """Step a board for the given number of generations, stopping early once it cycles
+
+    Returns the generation reached and the period found, if any. With fast_forward the board is left in the exact state it
+    would have at the requested generation, by only stepping the remainder of the cycle. A board that steps several
+    generations per update is cut short on its last step, and its period is a multiple of that many generations.
+    """
+    detector = CycleDetector(board.grid.shape, max_period)
+    detector.observe(board.grid)
+    step = board.generations_per_update
+    generation = 0
+
+    while generation < generations:
+        if generations - generation < step:
+            advance(board, generations - generation)
+            return generations, None
+        board.update()
+        generation += step
+        period = detector.observe(board.grid, getattr(board, "changed", None))
+        if period is not None:
+            if fast_forward:
+                advance(board, (generations - generation) % (period * step))
+                generation = generations
+            return generation, period * step
+
+    return generation, None
+
+
+def advance(board, generations: int):
+    """Step a board exactly the given number of generations"""
+    step = board.generations_per_update
+    for _ in range(generations // step):
+        board.update()
+    # what is left is less than an update, only boards that step more than one generation at a time get here and those
+    # step any power of two with advance
+    remainder = generations % step
+    for log2 in range(remainder.bit_length()):
+        if remainder >> log2 & 1:
+            board.advance(log2)
@@ -0,0 +1,103 @@
+import math
+
+import numpy as np
+import pygame
+
+try:
+    from .constants import BLACK, WHITE, CELL_SIZE, ZOOM_LEVELS, PAN_STEP
+except ImportError:
+    from constants import BLACK, WHITE, CELL_SIZE, ZOOM_LEVELS, PAN_STEP
+
+
+class Viewport:
+    """Window onto a board that can be larger than the screen
+
+    scale is the number of pixels per cell: whole numbers zoom in, fractions like 1/4 zoom out so that each pixel
+    covers a block of cells and shows whether any of them is alive.
+    """
+
+    def __init__(self, board_shape: tuple[int, int], screen_size: tuple[int, int], scale: float = CELL_SIZE):
+        self.board_rows, self.board_cols = board_shape
+        self.screen_width, self.screen_height = screen_size
+        self.scale = scale
+        self.top = 0
+        self.left = 0
+
+    @property
+    def block(self) -> int:
+        # cells per pixel side, 1 when zoomed in
+        return max(1, round(1 / self.scale))
+
+    @property
+    def cell_pixels(self) -> int:
+        # pixels per cell side, 1 when zoomed out
+        return max(1, int(self.scale))
+
+    @property
+    def visible_rows(self) -> int:
+        return math.ceil(self.screen_height / self.cell_pixels) * self.block
+
+    @property
+    def visible_cols(self) -> int:
+        return math.ceil(self.screen_width / self.cell_pixels) * self.block
+
+    def zoom(self, steps: int):
+        # zoom around the center of the screen
+        center_i = self.top + self.visible_rows // 2
+        center_j = self.left + self.visible_cols // 2
+        levels = sorted(set(ZOOM_LEVELS) | {self.scale})
+        index = min(max(levels.index(self.scale) + steps, 0), len(levels) - 1)
+        self.scale = levels[index]
+        self.top = center_i - self.visible_rows // 2
+        self.left = center_j - self.visible_cols // 2
+        self._clamp()
+
+    def pan(self, rows: int, cols: int):
+        # pan by a number of PAN_STEP pixel steps
+        self.top += rows * PAN_STEP * self.block // self.cell_pixels
+        self.left += cols * PAN_STEP * self.block // self.cell_pixels
+        self._clamp()
+
+    def to_cell(self, pos: tuple[int, int]) -> tuple[int, int] | None:
+        i = self.top + pos[1] // self.cell_pixels * self.block
+        j = self.left + pos[0] // self.cell_pixels * self.block
+        if 0 <= i < self.board_rows and 0 <= j < self.board_cols:
+            return i, j
+        return None
+
+    def _clamp(self):
+        self.top = min(max(self.top, 0), max(self.board_rows - self.visible_rows, 0))
+        self.left = min(max(self.left, 0), max(self.board_cols - self.visible_cols, 0))
+
+
+class GridRenderer:
+    """Draws a grid by writing it into a one pixel per cell surface and blitting that scaled up
+
+    Frame time only depends on the size of the viewport, not on how many cells are alive.
+    """
+
+    def __init__(self):
+        self.surface: pygame.Surface | None = None
+
+    def draw(self, screen: pygame.Surface, grid: np.ndarray, viewport: Viewport):
+        cells = grid[viewport.top : viewport.top + viewport.visible_rows, viewport.left : viewport.left + viewport.visible_cols]
+        pixels = _reduce_blocks(cells, viewport.block) if viewport.block > 1 else cells != 0
+        height, width = pixels.shape
+        if width == 0 or height == 0:
+            return
+
+        if self.surface is None or self.surface.get_size() != (width, height):
+            self.surface = pygame.Surface((width, height), depth=8)
+            self.surface.set_palette([BLACK, WHITE])
+        pygame.surfarray.blit_array(self.surface, pixels.T.astype(np.uint8))
+
+        size = viewport.cell_pixels
+        screen.blit(pygame.transform.scale(self.surface, (width * size, height * size)), (0, 0))
+
+
+def _reduce_blocks(cells: np.ndarray, block: int) -> np.ndarray:
+    # a pixel is lit when any cell of its block x block square is alive
+    rows, cols = cells.shape
+    padded = np.zeros((-(-rows // block) * block, -(-cols // block) * block), dtype=bool)
+    padded[:rows, :cols] = cells != 0
+    return padded.reshape(padded.shape[0] // block, block, padded.shape[1] // block, block).any(axis=(1, 3))
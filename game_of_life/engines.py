@@ -0,0 +1,22 @@
+try:
+    from .game_logic import Board
+    from .packed import PackedBoard
+    from .hashlife import HashlifeBoard
+    from .sparse import SparseBoard
+    from .parallel import ParallelBoard
+except ImportError:
+    from game_logic import Board
+    from packed import PackedBoard
+    from hashlife import HashlifeBoard
+    from sparse import SparseBoard
+    from parallel import ParallelBoard
+
+
+# every board takes the initial NumPy grid and exposes update(), toggle(i, j), grid, population and generations_per_update
+ENGINES = {
+    "numpy": Board,
+    "packed": PackedBoard,
+    "hashlife": HashlifeBoard,
+    "sparse": SparseBoard,
+    "parallel": ParallelBoard,
+}
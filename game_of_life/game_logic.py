@@ -0,0 +1,71 @@
+import numpy as np
+
+try:
+    from .rules import Rule, parse_rule
+    from .constants import RULE, EDGE
+except ImportError:
+    from rules import Rule, parse_rule
+    from constants import RULE, EDGE
+
+
+# how the cells beyond the edge are filled in: always dead, wrapped around, or mirrored copies of the edge cells
+EDGE_MODES = {
+    "dead": "constant",
+    "toroidal": "wrap",
+    "mirrored": "symmetric",
+}
+
+
+class Board:
+    """Game of Life board backed by a plain NumPy grid"""
+
+    generations_per_update = 1
+
+    def __init__(self, grid: np.ndarray, rule: str = RULE, edge: str = EDGE):
+        self.cells = grid.copy()
+        self.rule = parse_rule(rule)
+        self.edge = edge
+
+    @property
+    def grid(self) -> np.ndarray:
+        return self.cells
+
+    @property
+    def population(self) -> int:
+        return int(np.sum(self.cells))
+
+    def update(self):
+        self.cells = update(self.cells, self.rule, self.edge)
+
+    def toggle(self, i: int, j: int):
+        self.cells[i, j] = 1 - self.cells[i, j]
+
+
+def update(grid: np.ndarray, rule: Rule | None = None, edge: str = "dead") -> np.ndarray:
+    live_neighbors = count_neighbors(grid, edge)
+
+    if rule is None or rule.is_conway:
+        # Apply Conway's rules: born with exactly three neighbors, survives with two or three
+        alive = (live_neighbors == 3) | ((grid == 1) & (live_neighbors == 2))
+        return alive.astype(grid.dtype)
+
+    # Any other Life-like rule: look the next state up by current state and neighbor count
+    return rule.table[((grid != 0).view(np.uint8) << 4) | live_neighbors].astype(grid.dtype)
+
+
+def count_neighbors(grid: np.ndarray, edge: str = "dead") -> np.ndarray:
+    rows, cols = grid.shape
+
+    # Count live neighbors of every cell at once by summing the eight shifted views of a padded copy,
+    # the padding holds the cells beyond the edge as given by the edge mode
+    if edge == "dead":
+        padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = grid
+    else:
+        padded = np.pad(grid.astype(np.uint8, copy=False), 1, mode=EDGE_MODES[edge])
+    live_neighbors = np.zeros((rows, cols), dtype=np.uint8)
+    for di in range(3):
+        for dj in range(3):
+            if (di, dj) != (1, 1):
+                live_neighbors += padded[di : di + rows, dj : dj + cols]
+    return live_neighbors
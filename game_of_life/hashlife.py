@@ -0,0 +1,258 @@
+"""Hashlife: Game of Life on a quadtree of canonical nodes with memoized results
+
+Every distinct square of cells is stored once (hash-consing), and the result of advancing a node is cached, so repeated
+structure in space and time is only ever computed once. This makes jumps of 2^k generations in a single call feasible.
+
+Unlike the other boards, Hashlife simulates the unbounded plane: the NumPy grid it is built from and exported to is a
+window onto that plane, so results only match the other boards while the pattern stays clear of the window edges.
+"""
+
+import numpy as np
+
+
+MIN_LEVEL = 3
+MAX_CACHE_SIZE = 1_000_000  # memoized results kept before the caches are cleared, None keeps everything
+
+
+class Node:
+    """Square of 2^level x 2^level cells made of four canonical quadrants"""
+
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population")
+
+    def __init__(self, level: int, nw: "Node | None", ne: "Node | None", sw: "Node | None", se: "Node | None", population: int):
+        self.level = level
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.population = population
+
+
+class HashlifeBoard:
+    """Game of Life board backed by a Hashlife quadtree
+
+    Each update() advances 2^step_log2 generations. When the result cache grows past max_cache_size it is cleared and the
+    node table is rebuilt from the current pattern, dropping every node that is no longer reachable.
+    """
+
+    def __init__(self, grid: np.ndarray, step_log2: int = 0, max_cache_size: int | None = MAX_CACHE_SIZE):
+        self.rows, self.cols = grid.shape
+        self.step_log2 = step_log2
+        self.max_cache_size = max_cache_size
+        self.generation = 0
+
+        self._nodes: dict[tuple[Node, Node, Node, Node], Node] = {}
+        self._results: dict[tuple[Node, int], Node] = {}
+        self._off = Node(0, None, None, None, None, 0)
+        self._on = Node(0, None, None, None, None, 1)
+        self._empties = [self._off]
+
+        level = max(MIN_LEVEL, (max(self.rows, self.cols) - 1).bit_length())
+        self.root = self._build(grid, 0, 0, level)
+        self.origin = (0, 0)  # board coordinates of the root's top left cell
+
+    @property
+    def generations_per_update(self) -> int:
+        return 2**self.step_log2
+
+    @property
+    def grid(self) -> np.ndarray:
+        grid = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        self._paint(grid, self.root, self.origin[0], self.origin[1])
+        return grid
+
+    @property
+    def population(self) -> int:
+        # live cells on the whole plane, including any that left the window
+        return self.root.population
+
+    @property
+    def cache_size(self) -> int:
+        return len(self._results)
+
+    def update(self):
+        self.advance(self.step_log2)
+
+    def advance(self, log2_generations: int):
+        """Advance the board 2^log2_generations generations in one step"""
+        # Grow the root until it is big enough for the jump and the pattern sits inside its center,
+        # then once more so nothing can travel out of the result during the jump
+        while self.root.level < log2_generations + 2 or self._center(self.root).population != self.root.population:
+            self._expand_root()
+        self._expand_root()
+
+        offset = 2 ** (self.root.level - 2)
+        self.root = self._successor(self.root, log2_generations)
+        self.origin = (self.origin[0] + offset, self.origin[1] + offset)
+        self.generation += 2**log2_generations
+
+        if self.max_cache_size is not None and len(self._results) > self.max_cache_size:
+            self._collect()
+
+    def toggle(self, i: int, j: int):
+        while not self._contains(i, j):
+            self._expand_root()
+        self.root = self._toggle(self.root, i - self.origin[0], j - self.origin[1])
+
+    def _contains(self, i: int, j: int) -> bool:
+        size = 2**self.root.level
+        return 0 <= i - self.origin[0] < size and 0 <= j - self.origin[1] < size
+
+    def _expand_root(self):
+        # center the root in a node twice its size
+        root = self.root
+        empty = self._empty(root.level - 1)
+        self.root = self._join(
+            self._join(empty, empty, empty, root.nw),
+            self._join(empty, empty, root.ne, empty),
+            self._join(empty, root.sw, empty, empty),
+            self._join(root.se, empty, empty, empty),
+        )
+        shift = 2 ** (root.level - 1)
+        self.origin = (self.origin[0] - shift, self.origin[1] - shift)
+
+    def _join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = Node(nw.level + 1, nw, ne, sw, se, nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+        return node
+
+    def _empty(self, level: int) -> Node:
+        while len(self._empties) <= level:
+            empty = self._empties[-1]
+            self._empties.append(self._join(empty, empty, empty, empty))
+        return self._empties[level]
+
+    def _center(self, node: Node) -> Node:
+        return self._join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def _successor(self, node: Node, j: int) -> Node:
+        """Center half of the node, 2^j generations later (j is capped at level - 2)"""
+        if node.population == 0:
+            return node.nw
+
+        j = min(j, node.level - 2)
+        key = (node, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join = self._join
+
+            # nine overlapping sub-squares, each advanced and reduced to its center
+            c1 = self._successor(nw, j)
+            c2 = self._successor(join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = self._successor(ne, j)
+            c4 = self._successor(join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = self._successor(join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = self._successor(join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = self._successor(sw, j)
+            c8 = self._successor(join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = self._successor(se, j)
+
+            if j < node.level - 2:
+                # the sub-squares already went the full 2^j generations, just take the centers
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw),
+                    join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw),
+                    join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                # the sub-squares went half way, advance the four recombined squares the other half
+                result = join(
+                    self._successor(join(c1, c2, c4, c5), j),
+                    self._successor(join(c2, c3, c5, c6), j),
+                    self._successor(join(c4, c5, c7, c8), j),
+                    self._successor(join(c5, c6, c8, c9), j),
+                )
+
+        self._results[key] = result
+        return result
+
+    def _life_4x4(self, node: Node) -> Node:
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        cells = [
+            [nw.nw.population, nw.ne.population, ne.nw.population, ne.ne.population],
+            [nw.sw.population, nw.se.population, ne.sw.population, ne.se.population],
+            [sw.nw.population, sw.ne.population, se.nw.population, se.ne.population],
+            [sw.sw.population, sw.se.population, se.sw.population, se.se.population],
+        ]
+
+        def next_cell(i: int, j: int) -> Node:
+            live_neighbors = sum(cells[x][y] for x in range(i - 1, i + 2) for y in range(j - 1, j + 2)) - cells[i][j]
+            if live_neighbors == 3 or (cells[i][j] == 1 and live_neighbors == 2):
+                return self._on
+            return self._off
+
+        return self._join(next_cell(1, 1), next_cell(1, 2), next_cell(2, 1), next_cell(2, 2))
+
+    def _build(self, grid: np.ndarray, top: int, left: int, level: int) -> Node:
+        if top >= grid.shape[0] or left >= grid.shape[1]:
+            return self._empty(level)  # the part of the square past the board's edge
+        if level == 0:
+            return self._on if grid[top, left] else self._off
+
+        size = 2**level
+        if not grid[top : top + size, left : left + size].any():
+            return self._empty(level)
+
+        half = size // 2
+        return self._join(
+            self._build(grid, top, left, level - 1),
+            self._build(grid, top, left + half, level - 1),
+            self._build(grid, top + half, left, level - 1),
+            self._build(grid, top + half, left + half, level - 1),
+        )
+
+    def _paint(self, grid: np.ndarray, node: Node, top: int, left: int):
+        size = 2**node.level
+        if node.population == 0 or top >= self.rows or left >= self.cols or top + size <= 0 or left + size <= 0:
+            return
+
+        if node.level == 0:
+            grid[top, left] = 1
+            return
+
+        half = size // 2
+        self._paint(grid, node.nw, top, left)
+        self._paint(grid, node.ne, top, left + half)
+        self._paint(grid, node.sw, top + half, left)
+        self._paint(grid, node.se, top + half, left + half)
+
+    def _toggle(self, node: Node, i: int, j: int) -> Node:
+        if node.level == 0:
+            return self._off if node.population else self._on
+
+        half = 2 ** (node.level - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if i < half and j < half:
+            nw = self._toggle(nw, i, j)
+        elif i < half:
+            ne = self._toggle(ne, i, j - half)
+        elif j < half:
+            sw = self._toggle(sw, i - half, j)
+        else:
+            se = self._toggle(se, i - half, j - half)
+        return self._join(nw, ne, sw, se)
+
+    def _collect(self):
+        # drop the memoized results and every node the root and the empty nodes no longer reach
+        self._results.clear()
+        nodes = {}
+        stack = [self.root, *self._empties]
+        while stack:
+            node = stack.pop()
+            if node.level == 0:
+                continue
+            key = (node.nw, node.ne, node.sw, node.se)
+            if key not in nodes:
+                nodes[key] = node
+                stack.extend(key)
+        self._nodes = nodes
@@ -0,0 +1,120 @@
+import numpy as np
+
+
+WORD_BITS = 64
+
+_ONE = np.uint64(1)
+_HIGH_BIT_SHIFT = np.uint64(WORD_BITS - 1)
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class PackedBoard:
+    """Game of Life board storing 64 cells per uint64 word
+
+    Cell (i, j) lives in bit j % 64 of word j // 64 of row i. Padding bits past the last column are kept clear,
+    so they behave like the dead cells beyond the edge of the plain NumPy board.
+    """
+
+    generations_per_update = 1
+
+    def __init__(self, grid: np.ndarray):
+        self.rows, self.cols = grid.shape
+        self.words = pack(grid)
+
+    @classmethod
+    def from_words(cls, words: np.ndarray, cols: int) -> "PackedBoard":
+        """Board from already packed words, e.g. a memory-mapped snapshot, without unpacking them"""
+        board = cls.__new__(cls)
+        board.rows, board.cols = words.shape[0], cols
+        board.words = np.array(words, dtype=np.uint64)
+        return board
+
+    @property
+    def grid(self) -> np.ndarray:
+        return unpack(self.words, self.cols)
+
+    @property
+    def population(self) -> int:
+        return int(_POPCOUNT[self.words.view(np.uint8)].sum(dtype=np.int64))
+
+    def update(self):
+        self.words = update_packed(self.words, self.cols)
+
+    def toggle(self, i: int, j: int):
+        self.words[i, j // WORD_BITS] ^= _ONE << np.uint64(j % WORD_BITS)
+
+
+def pack(grid: np.ndarray) -> np.ndarray:
+    rows, cols = grid.shape
+    num_words = -(-cols // WORD_BITS)
+    bits = np.zeros((rows, num_words * WORD_BITS), dtype=np.uint8)
+    bits[:, :cols] = grid != 0
+    return np.packbits(bits, axis=1, bitorder="little").view("<u8").astype(np.uint64)
+
+
+def unpack(words: np.ndarray, cols: int) -> np.ndarray:
+    bits = np.unpackbits(words.astype("<u8").view(np.uint8), axis=1, bitorder="little")
+    return bits[:, :cols]
+
+
+def update_packed(words: np.ndarray, cols: int) -> np.ndarray:
+    # The eight neighbors of every cell as whole-word bit planes, rows and columns past the edge are dead
+    west = _shift_west(words)
+    east = _shift_east(words)
+    north, north_west, north_east = _shift_down(words), _shift_down(west), _shift_down(east)
+    south, south_west, south_east = _shift_up(words), _shift_up(west), _shift_up(east)
+
+    # Sum the neighbors with bitwise adders, giving the count's bits (ones, twos, fours) in parallel for 64 cells per word.
+    # A count of 8 wraps to 0, which like 0 neither births nor keeps a cell alive
+    above_sum, above_carry = _full_adder(north_west, north, north_east)
+    below_sum, below_carry = _full_adder(south_west, south, south_east)
+    middle_sum, middle_carry = west ^ east, west & east
+    ones, ones_carry = _full_adder(above_sum, below_sum, middle_sum)
+    twos_sum, twos_carry = _full_adder(above_carry, below_carry, middle_carry)
+    twos = twos_sum ^ ones_carry
+    fours = twos_carry ^ (twos_sum & ones_carry)
+
+    # Apply Conway's rules: a count of 3 (twos and ones) or a live cell with a count of 2 (twos only)
+    new_words = twos & ~fours & (ones | words)
+    new_words[:, -1] &= _last_word_mask(cols)
+    return new_words
+
+
+def _full_adder(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+def _shift_west(words: np.ndarray) -> np.ndarray:
+    # each cell takes the value of its left neighbor
+    shifted = words << _ONE
+    shifted[:, 1:] |= words[:, :-1] >> _HIGH_BIT_SHIFT
+    return shifted
+
+
+def _shift_east(words: np.ndarray) -> np.ndarray:
+    # each cell takes the value of its right neighbor
+    shifted = words >> _ONE
+    shifted[:, :-1] |= words[:, 1:] << _HIGH_BIT_SHIFT
+    return shifted
+
+
+def _shift_down(words: np.ndarray) -> np.ndarray:
+    # each cell takes the value of the cell above it
+    shifted = np.zeros_like(words)
+    shifted[1:] = words[:-1]
+    return shifted
+
+
+def _shift_up(words: np.ndarray) -> np.ndarray:
+    # each cell takes the value of the cell below it
+    shifted = np.zeros_like(words)
+    shifted[:-1] = words[1:]
+    return shifted
+
+
+def _last_word_mask(cols: int) -> np.uint64:
+    used_bits = cols % WORD_BITS
+    if used_bits == 0:
+        return np.uint64(np.iinfo(np.uint64).max)
+    return (_ONE << np.uint64(used_bits)) - _ONE
@@ -0,0 +1,107 @@
+import os
+import time
+import weakref
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+try:
+    from .game_logic import update
+except ImportError:
+    from game_logic import update
+
+
+# shared grid buffers attached in each worker process
+_worker_memory: list[SharedMemory] = []
+_worker_buffers: list[np.ndarray] = []
+
+
+class ParallelBoard:
+    """Game of Life board stepped by a pool of worker processes
+
+    The grid lives in two shared memory buffers, the current generation and the next one. Each worker steps a horizontal
+    band of rows and reads the row just above and below its band straight from the current buffer (the one-row halo),
+    so the result is identical to game_logic.update on the whole grid.
+    """
+
+    generations_per_update = 1
+
+    def __init__(self, grid: np.ndarray, workers: int | None = None):
+        rows, cols = grid.shape
+        self.shape = (rows, cols)
+        self.workers = max(1, min(workers or os.cpu_count() or 1, rows))
+
+        self._memory = [SharedMemory(create=True, size=max(1, rows * cols)) for _ in range(2)]
+        self._buffers = [np.ndarray(self.shape, dtype=np.uint8, buffer=memory.buf) for memory in self._memory]
+        self._buffers[0][...] = grid != 0
+        self._current = 0
+
+        bounds = np.linspace(0, rows, self.workers + 1).astype(int)
+        self.bands = list(zip(bounds[:-1], bounds[1:]))
+
+        names = [memory.name for memory in self._memory]
+        self._pool = Pool(self.workers, initializer=_attach_buffers, initargs=(names, self.shape))
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._memory)
+
+    @property
+    def grid(self) -> np.ndarray:
+        return self._buffers[self._current].copy()
+
+    @property
+    def population(self) -> int:
+        return int(np.count_nonzero(self._buffers[self._current]))
+
+    def update(self):
+        source, target = self._current, 1 - self._current
+        self._pool.starmap(_step_band, [(source, target, top, bottom) for top, bottom in self.bands])
+        self._current = target
+
+    def toggle(self, i: int, j: int):
+        cells = self._buffers[self._current]
+        cells[i, j] = 1 - cells[i, j]
+
+    def close(self):
+        self._finalizer()
+
+
+def _attach_buffers(names: list[str], shape: tuple[int, int]):
+    global _worker_memory, _worker_buffers
+    _worker_memory = [SharedMemory(name=name) for name in names]
+    _worker_buffers = [np.ndarray(shape, dtype=np.uint8, buffer=memory.buf) for memory in _worker_memory]
+
+
+def _step_band(source: int, target: int, top: int, bottom: int):
+    cells = _worker_buffers[source]
+    halo_top = max(top - 1, 0)
+    halo_bottom = min(bottom + 1, cells.shape[0])
+    stepped = update(cells[halo_top:halo_bottom])
+    _worker_buffers[target][top:bottom] = stepped[top - halo_top : bottom - halo_top]
+
+
+def _release(pool, memory: list[SharedMemory]):
+    pool.terminate()
+    pool.join()
+    for block in memory:
+        block.close()
+        block.unlink()
+
+
+def benchmark(size: int = 2000, generations: int = 20, max_workers: int | None = None) -> list[tuple[int, float]]:
+    """Generations per second of a random size x size board for 1..max_workers workers"""
+    grid = np.random.default_rng(0).integers(2, size=(size, size), dtype=np.uint8)
+    results = []
+    for workers in range(1, (max_workers or os.cpu_count() or 1) + 1):
+        board = ParallelBoard(grid, workers)
+        board.update()  # let the pool warm up
+        start_time = time.perf_counter()
+        for _ in range(generations):
+            board.update()
+        results.append((workers, generations / (time.perf_counter() - start_time)))
+        board.close()
+    return results
+
+
+if __name__ == "__main__":
+    for workers, generations_per_second in benchmark():
+        print(f"{workers} workers: {generations_per_second:.1f} generations/s")
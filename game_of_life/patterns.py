@@ -0,0 +1,178 @@
+"""Reading and writing Game of Life patterns
+
+- RLE (.rle): the run-length format used by most pattern collections, e.g. `x = 3, y = 3` followed by `bo$2bo$3o!`
+- plaintext (.cells): one line per row, `.` for dead and `O` for live cells, `!` starts a comment line
+- snapshot (.gol): a header with the board size and generation followed by the board packed 64 cells per word, read back
+  memory-mapped so large boards never pass through Python lists
+"""
+
+import os
+import re
+import struct
+
+import numpy as np
+
+try:
+    from .packed import WORD_BITS, pack, unpack
+except ImportError:
+    from packed import WORD_BITS, pack, unpack
+
+
+RLE_LINE_LENGTH = 70
+SNAPSHOT_MAGIC = b"GOLSNAP1"
+SNAPSHOT_HEADER = struct.Struct("<8sQQQ")  # magic, rows, cols, generation
+
+_RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)")
+_RLE_TOKEN = re.compile(r"(\d*)([a-zA-Z$!])")
+
+
+def load_pattern(path: str) -> tuple[np.ndarray, int]:
+    """Load a pattern by its file extension, returning the grid and its generation"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".rle":
+        return load_rle(path), 0
+    if extension == ".cells":
+        return load_cells(path), 0
+    if extension == ".gol":
+        return load_snapshot(path)
+    raise ValueError(f"Unknown pattern format: {path}")
+
+
+def load_rle(path: str) -> np.ndarray:
+    with open(path, encoding="utf-8") as f:
+        return parse_rle(f.read())
+
+
+def parse_rle(text: str) -> np.ndarray:
+    lines = [line.strip() for line in text.splitlines()]
+    lines = [line for line in lines if line and not line.startswith("#")]
+    if not lines:
+        raise ValueError("Empty RLE pattern")
+
+    header = _RLE_HEADER.match(lines[0])
+    if header is None:
+        raise ValueError(f"Invalid RLE header: {lines[0]}")
+    cols, rows = int(header.group(1)), int(header.group(2))
+    grid = np.zeros((rows, cols), dtype=np.uint8)
+
+    i = j = 0
+    for count, tag in _RLE_TOKEN.findall("".join(lines[1:])):
+        run = int(count) if count else 1
+        if tag == "!":
+            break
+        if tag == "$":
+            i += run
+            j = 0
+        else:
+            if tag != "b":  # every state other than dead counts as alive
+                grid[i, j : j + run] = 1
+            j += run
+    return grid
+
+
+def save_rle(path: str, grid: np.ndarray, name: str | None = None):
+    with open(path, "w", encoding="utf-8") as f:
+        if name:
+            f.write(f"#N {name}\n")
+        f.write(format_rle(grid))
+
+
+def format_rle(grid: np.ndarray) -> str:
+    rows, cols = grid.shape
+    tokens = []
+    pending_rows = 0
+    for row in grid != 0:
+        live = np.flatnonzero(row)
+        if live.size == 0:
+            pending_rows += 1
+            continue
+        tokens.append(_rle_run(pending_rows, "$"))
+        pending_rows = 1
+
+        # boundaries between runs of equal cells, trailing dead cells are left out
+        row = row[: live[-1] + 1]
+        starts = np.flatnonzero(np.diff(row.astype(np.int8))) + 1
+        bounds = np.concatenate(([0], starts, [row.size]))
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            tokens.append(_rle_run(int(end - start), "o" if row[start] else "b"))
+    tokens.append("!")
+
+    lines = [f"x = {cols}, y = {rows}, rule = B3/S23"]
+    line = ""
+    for token in tokens:
+        if len(line) + len(token) > RLE_LINE_LENGTH:
+            lines.append(line)
+            line = ""
+        line += token
+    lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def _rle_run(count: int, tag: str) -> str:
+    if count == 0:
+        return ""
+    return f"{count}{tag}" if count > 1 else tag
+
+
+def load_cells(path: str) -> np.ndarray:
+    with open(path, encoding="utf-8") as f:
+        return parse_cells(f.read())
+
+
+def parse_cells(text: str) -> np.ndarray:
+    rows = [line.rstrip() for line in text.splitlines() if not line.startswith("!")]
+    grid = np.zeros((len(rows), max((len(row) for row in rows), default=0)), dtype=np.uint8)
+    for i, row in enumerate(rows):
+        grid[i, : len(row)] = np.frombuffer(row.encode("ascii"), dtype=np.uint8) != ord(".")
+    return grid
+
+
+def save_cells(path: str, grid: np.ndarray, name: str | None = None):
+    with open(path, "w", encoding="utf-8") as f:
+        if name:
+            f.write(f"!Name: {name}\n")
+        f.write(format_cells(grid))
+
+
+def format_cells(grid: np.ndarray) -> str:
+    chars = np.where(grid != 0, ord("O"), ord(".")).astype(np.uint8)
+    return "".join(row.tobytes().decode("ascii").rstrip(".") + "\n" for row in chars)
+
+
+def save_snapshot(path: str, grid: np.ndarray, generation: int = 0):
+    write_snapshot(path, pack(grid), grid.shape[1], generation)
+
+
+def write_snapshot(path: str, words: np.ndarray, cols: int, generation: int = 0):
+    """Write already packed words (see packed.pack) straight to a snapshot file"""
+    with open(path, "wb") as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, words.shape[0], cols, generation))
+        words.astype("<u8", copy=False).tofile(f)
+
+
+def load_snapshot(path: str) -> tuple[np.ndarray, int]:
+    words, cols, generation = read_snapshot(path)
+    return unpack(words, cols), generation
+
+
+def read_snapshot(path: str) -> tuple[np.memmap, int, int]:
+    """Memory-map the packed words of a snapshot, returning them with the column count and generation"""
+    with open(path, "rb") as f:
+        magic, rows, cols, generation = SNAPSHOT_HEADER.unpack(f.read(SNAPSHOT_HEADER.size))
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError(f"Not a Game of Life snapshot: {path}")
+
+    num_words = -(-cols // WORD_BITS)
+    words = np.memmap(path, dtype="<u8", mode="r", offset=SNAPSHOT_HEADER.size, shape=(rows, num_words))
+    return words, cols, generation
+
+
+def place(pattern: np.ndarray, shape: tuple[int, int]) -> np.ndarray:
+    """Center a pattern on an empty grid of at least the given shape"""
+    rows = max(shape[0], pattern.shape[0])
+    cols = max(shape[1], pattern.shape[1])
+    grid = np.zeros((rows, cols), dtype=np.uint8)
+    top = (rows - pattern.shape[0]) // 2
+    left = (cols - pattern.shape[1]) // 2
+    grid[top : top + pattern.shape[0], left : left + pattern.shape[1]] = pattern != 0
+    return grid
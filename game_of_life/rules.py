@@ -0,0 +1,60 @@
+"""Life-like rules in B/S notation
+
+A rule lists the neighbor counts at which a dead cell is born and a live cell survives, e.g. `B3/S23` for Conway's Game
+of Life or `B36/S23` for HighLife. The older S/B form (`23/36`) and the names in RULES are accepted too.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+
+
+RULES = {
+    "life": "B3/S23",
+    "highlife": "B36/S23",
+    "seeds": "B2/S",
+    "day_and_night": "B3678/S34678",
+    "life_without_death": "B3/S012345678",
+    "morley": "B368/S245",
+    "2x2": "B36/S125",
+}
+
+_BS_NOTATION = re.compile(r"^B([0-8]*)/S([0-8]*)$", re.IGNORECASE)
+_SB_NOTATION = re.compile(r"^([0-8]*)/([0-8]*)$")
+
+
+@dataclass(frozen=True)
+class Rule:
+    birth: frozenset[int]
+    survival: frozenset[int]
+
+    def __str__(self) -> str:
+        return f"B{''.join(map(str, sorted(self.birth)))}/S{''.join(map(str, sorted(self.survival)))}"
+
+    @property
+    def is_conway(self) -> bool:
+        return self == CONWAY
+
+    @cached_property
+    def table(self) -> np.ndarray:
+        """Lookup table of the next state, indexed by current state << 4 | live neighbor count"""
+        table = np.zeros((2, 16), dtype=np.uint8)
+        table[0, sorted(self.birth)] = 1
+        table[1, sorted(self.survival)] = 1
+        return table.ravel()
+
+
+def parse_rule(text: str) -> Rule:
+    text = RULES.get(text.strip().lower(), text).strip()
+    if match := _BS_NOTATION.match(text):
+        birth, survival = match.groups()
+    elif match := _SB_NOTATION.match(text):
+        survival, birth = match.groups()
+    else:
+        raise ValueError(f"Invalid rule: {text}")
+    return Rule(frozenset(map(int, birth)), frozenset(map(int, survival)))
+
+
+CONWAY = Rule(frozenset({3}), frozenset({2, 3}))
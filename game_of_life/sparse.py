@@ -0,0 +1,110 @@
+import numpy as np
+
+try:
+    from .game_logic import update
+except ImportError:
+    from game_logic import update
+
+
+TILE_SIZE = 32
+DENSE_FRACTION = 0.5  # above this share of active tiles a single whole-grid update is cheaper
+
+
+class SparseBoard:
+    """Game of Life board that only recomputes the tiles that can change
+
+    A tile can only change if it or one of its eight neighbor tiles changed in the previous generation, every other tile
+    is skipped. After each update() tiles_evaluated and tiles_skipped hold the counts for that generation and changed the
+    row and column indices of the cells that flipped, or None before the first update and after a toggle.
+    """
+
+    generations_per_update = 1
+
+    def __init__(self, grid: np.ndarray, tile_size: int = TILE_SIZE):
+        self.cells = grid.copy()
+        self.tile_size = tile_size
+        rows, cols = grid.shape
+        self.tile_rows = -(-rows // tile_size)
+        self.tile_cols = -(-cols // tile_size)
+        self.dirty = np.ones((self.tile_rows, self.tile_cols), dtype=bool)  # nothing is known to be stable yet
+        self.tiles_evaluated = 0
+        self.tiles_skipped = 0
+        self.changed: tuple[np.ndarray, np.ndarray] | None = None
+
+    @property
+    def grid(self) -> np.ndarray:
+        return self.cells
+
+    @property
+    def population(self) -> int:
+        return int(np.sum(self.cells))
+
+    @property
+    def num_tiles(self) -> int:
+        return self.tile_rows * self.tile_cols
+
+    def update(self):
+        active = _dilate(self.dirty)
+        self.tiles_evaluated = int(np.count_nonzero(active))
+        self.tiles_skipped = self.num_tiles - self.tiles_evaluated
+
+        if self.tiles_evaluated > self.num_tiles * DENSE_FRACTION:
+            self._update_dense()
+        else:
+            self._update_tiles(active)
+
+    def toggle(self, i: int, j: int):
+        self.cells[i, j] = 1 - self.cells[i, j]
+        self.dirty[i // self.tile_size, j // self.tile_size] = True
+        self.changed = None
+
+    def _update_dense(self):
+        new_cells = update(self.cells)
+        changed = new_cells != self.cells
+        self.cells = new_cells
+        self.changed = np.nonzero(changed)
+
+        rows, cols = changed.shape
+        padded = np.zeros((self.tile_rows * self.tile_size, self.tile_cols * self.tile_size), dtype=bool)
+        padded[:rows, :cols] = changed
+        self.dirty = padded.reshape(self.tile_rows, self.tile_size, self.tile_cols, self.tile_size).any(axis=(1, 3))
+
+    def _update_tiles(self, active: np.ndarray):
+        rows, cols = self.cells.shape
+        size = self.tile_size
+        results = []
+
+        # evaluate every active tile on the current generation before writing any of them back
+        for tile_i, tile_j in zip(*np.nonzero(active)):
+            top, left = tile_i * size, tile_j * size
+            bottom, right = min(top + size, rows), min(left + size, cols)
+
+            # one cell halo around the tile, clipped at the board edges where the cells beyond are dead anyway
+            halo_top, halo_left = max(top - 1, 0), max(left - 1, 0)
+            block = update(self.cells[halo_top : min(bottom + 1, rows), halo_left : min(right + 1, cols)])
+            new_tile = block[top - halo_top : bottom - halo_top, left - halo_left : right - halo_left]
+            results.append((tile_i, tile_j, top, left, bottom, right, new_tile))
+
+        self.dirty = np.zeros_like(self.dirty)
+        changed_rows, changed_cols = [np.zeros(0, dtype=np.intp)], [np.zeros(0, dtype=np.intp)]
+        for tile_i, tile_j, top, left, bottom, right, new_tile in results:
+            old_tile = self.cells[top:bottom, left:right]
+            tile_rows, tile_cols = np.nonzero(old_tile != new_tile)
+            if len(tile_rows):
+                changed_rows.append(tile_rows + top)
+                changed_cols.append(tile_cols + left)
+                old_tile[...] = new_tile
+                self.dirty[tile_i, tile_j] = True
+        self.changed = (np.concatenate(changed_rows), np.concatenate(changed_cols))
+
+
+def _dilate(tiles: np.ndarray) -> np.ndarray:
+    # mark every tile next to a marked tile as well
+    rows, cols = tiles.shape
+    padded = np.zeros((rows + 2, cols + 2), dtype=bool)
+    padded[1:-1, 1:-1] = tiles
+    dilated = np.zeros_like(tiles)
+    for di in range(3):
+        for dj in range(3):
+            dilated |= padded[di : di + rows, dj : dj + cols]
+    return dilated
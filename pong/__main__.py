@@ -7,14 +7,22 @@ import pygame
 import neat
 
 try:
-    from constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, RED
+    from common.text_cache import render_text
+except ImportError:  # run as a script, only the game's own directory is on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.text_cache import render_text
+
+try:
+    from constants import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_FPS, BLACK, WHITE, RED
     from game_logic import Game
-    from draw import draw_game, draw_net, draw_scores
+    from game_loop import FixedTimestep, Snapshot
+    from draw import DirtyRectRenderer
     from ai import test_best_network
 except ImportError:
-    from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, RED
+    from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, RENDER_FPS, BLACK, WHITE, RED
     from .game_logic import Game
-    from .draw import draw_game, draw_net, draw_scores
+    from .game_loop import FixedTimestep, Snapshot
+    from .draw import DirtyRectRenderer
     from .ai import test_best_network
 
 
@@ -40,11 +48,6 @@ def display_menu(screen: pygame.Surface):
     waiting_for_selection = True
     selection = MenuSelection.SINGLE_PLAYER
 
-    font_100 = pygame.font.SysFont("comicsans", 100)
-    font_50 = pygame.font.SysFont("comicsans", 50)
-    font_28 = pygame.font.SysFont("comicsans", 28)
-    font_14 = pygame.font.SysFont("comicsans", 14)
-
     while waiting_for_selection:
 
         for event in pygame.event.get():
@@ -66,27 +69,27 @@ def display_menu(screen: pygame.Surface):
 
         screen.fill(BLACK)
 
-        txt = font_100.render("PONG", True, WHITE)
+        txt = render_text("PONG", "comicsans", 100, WHITE)
         txt_rect = txt.get_rect(center=(screen_width // 2, screen_height * 0.15))
         screen.blit(txt, txt_rect)
 
-        txt = font_50.render("Single Player", True, WHITE)
+        txt = render_text("Single Player", "comicsans", 50, WHITE)
         txt_rect1 = txt.get_rect(center=(screen_width // 2, screen_height * 0.4))
         screen.blit(txt, txt_rect1)
 
-        txt = font_50.render("Multi Player", True, WHITE)
+        txt = render_text("Multi Player", "comicsans", 50, WHITE)
         txt_rect2 = txt.get_rect(center=(screen_width // 2, screen_height * 0.55))
         screen.blit(txt, txt_rect2)
 
-        txt = font_14.render("Player 1: W (up), S (down)", True, WHITE)
+        txt = render_text("Player 1: W (up), S (down)", "comicsans", 14, WHITE)
         txt_rect = txt.get_rect(center=(screen_width // 2, screen_height * 0.7))
         screen.blit(txt, txt_rect)
 
-        txt = font_14.render("Player 2: Up Arrow, Down Arrow", True, WHITE)
+        txt = render_text("Player 2: Up Arrow, Down Arrow", "comicsans", 14, WHITE)
         txt_rect = txt.get_rect(center=(screen_width // 2, screen_height * 0.75))
         screen.blit(txt, txt_rect)
 
-        txt = font_28.render("Press SPACE to start", True, RED)
+        txt = render_text("Press SPACE to start", "comicsans", 28, RED)
         txt_rect = txt.get_rect(center=(screen_width // 2, screen_height * 0.9))
         screen.blit(txt, txt_rect)
 
@@ -115,11 +118,13 @@ def run_multi_player_game(screen: pygame.Surface):
     game = Game(screen_width, screen_height)
     draw_offset_x = (screen_width - game.game_area.width) // 2
     draw_offset_y = (screen_height - game.game_area.height) // 2
+    timestep = FixedTimestep()
+    previous = Snapshot.of(game)
+    renderer = DirtyRectRenderer(screen, draw_offset_x, draw_offset_y)
     running = True
-    fps = 60
 
     while running:
-        clock.tick(fps)
+        clock.tick(RENDER_FPS)  # only caps the frame rate, the physics runs at a fixed rate below
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -130,33 +135,30 @@ def run_multi_player_game(screen: pygame.Surface):
                     running = False
 
         keys = pygame.key.get_pressed()
-        if keys[pygame.K_UP]:
-            game.move_right_paddle_up()
-        if keys[pygame.K_DOWN]:
-            game.move_right_paddle_down()
-        if keys[pygame.K_w]:
-            game.move_left_paddle_up()
-        if keys[pygame.K_s]:
-            game.move_left_paddle_down()
+        for _ in range(timestep.ticks()):
+            previous = Snapshot.of(game)
+            if keys[pygame.K_UP]:
+                game.move_right_paddle_up()
+            if keys[pygame.K_DOWN]:
+                game.move_right_paddle_down()
+            if keys[pygame.K_w]:
+                game.move_left_paddle_up()
+            if keys[pygame.K_s]:
+                game.move_left_paddle_down()
 
-        game.update()
-
-        screen.fill(BLACK)
+            game.update()
 
-        draw_scores(screen, game, draw_offset_x, draw_offset_y)
-        draw_net(screen, game, draw_offset_x, draw_offset_y)
-        draw_game(screen, game, draw_offset_x, draw_offset_y)
+        dirty_rects = renderer.draw(game, previous.interpolate(game, timestep.alpha))
 
         if game.game_over:
-            font = pygame.font.SysFont("comicsans", 75)
-            txt = font.render("Game Over", True, RED)
+            txt = render_text("Game Over", "comicsans", 75, RED)
             txt_rect = txt.get_rect(center=(screen_width // 2, screen_height // 2))
             screen.blit(txt, txt_rect)
             pygame.display.flip()
             pygame.time.wait(3000)
             running = False
 
-        pygame.display.update((draw_offset_x, draw_offset_y, game.game_area.width, game.game_area.height))
+        pygame.display.update(dirty_rects)
 
 
 if __name__ == "__main__":
@@ -1,38 +1,69 @@
 import os
 import sys
-import time
 import pickle
+import random
+from collections.abc import Iterable
+from multiprocessing import Pool
 
 import neat
 import pygame
+import numpy as np
+
+try:
+    from common.compiled_net import CompiledNetwork, NetworkStack
+except ImportError:  # run as a script, only the game's own directory is on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.compiled_net import CompiledNetwork, NetworkStack
 
 try:
     from game_logic import Game
-    from draw import draw_game, draw_net, draw_scores, draw_hits
-    from constants import SCREEN_WIDTH, SCREEN_HEIGHT, BEST_PICKLE, CHECKPOINT_DIR, BLACK
+    from batch_logic import BatchGame
+    from game_loop import FixedTimestep, Snapshot
+    from prediction import collision_free_ticks, intercept
+    from checkpoints import CheckpointStore
+    from league import League
+    from draw import DirtyRectRenderer, draw_game, draw_net, draw_scores, draw_hits
+    from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, RENDER_FPS, TRAINING_SUBSTEPS, BEST_PICKLE, CHECKPOINT_DIR, BLACK
 except ImportError:
     from .game_logic import Game
-    from .draw import draw_game, draw_net, draw_scores, draw_hits
-    from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, BEST_PICKLE, CHECKPOINT_DIR, BLACK
+    from .batch_logic import BatchGame
+    from .game_loop import FixedTimestep, Snapshot
+    from .prediction import collision_free_ticks, intercept
+    from .checkpoints import CheckpointStore
+    from .league import League
+    from .draw import DirtyRectRenderer, draw_game, draw_net, draw_scores, draw_hits
+    from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, RENDER_FPS, TRAINING_SUBSTEPS, BEST_PICKLE, CHECKPOINT_DIR, BLACK
 
 
 DRAW = False
+MAX_SPEED = True  # train without pumping window events or drawing at all, even when a window is open
+FAST_FORWARD = True  # skip the frames of a headless match in which neither paddle moves, see PongAi._fast_forward
+MIN_FAST_FORWARD = 16  # fewer frames are quicker to play one by one
+MAX_FAST_FORWARD = 120  # most frames skipped at once
+BATCH_MIN_GAMES = 4  # play_matches_batch replays the last few long matches one by one, which is quicker for so few
+
+# neat config of a worker process and the networks it compiled for the matches of the current call, see ParallelEvaluator
+_worker_config: neat.Config
+_worker_networks: dict[int, CompiledNetwork] = {}
+_worker_call: int | None = None
 
 
 class PongAi:
 
-    def __init__(self, window: pygame.Surface, width: int, height: int):
-        self.genome1: neat.genome.DefaultGenome
-        self.genome2: neat.genome.DefaultGenome
-        self.game = Game(width, height)
-        self.window = window
+    def __init__(self, window: pygame.Surface | None, width: int, height: int, seed: int | str | None = None):
+        self.fitness1 = 0.0
+        self.fitness2 = 0.0
+        self.game = Game(width, height, seed)
+        self.window = window  # None runs headless
 
-    def test_ai(self, net: neat.nn.FeedForwardNetwork):
+    def test_ai(self, net: CompiledNetwork):
         clock = pygame.time.Clock()
+        timestep = FixedTimestep()
+        previous = Snapshot.of(self.game)
+        renderer = DirtyRectRenderer(self.window)
         run = True
         while run:
-            clock.tick(60)
-            self.game.update()
+            clock.tick(RENDER_FPS)  # only caps the frame rate, the physics runs at a fixed rate below
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -43,55 +74,60 @@ class PongAi:
                         run = False
                         break
 
-            output = net.activate((self.game.paddleR.y, abs(self.game.paddleR.x - self.game.ball.x), self.game.ball.y))
-            decision = output.index(max(output))
+            keys = pygame.key.get_pressed()
+            for _ in range(timestep.ticks()):
+                previous = Snapshot.of(self.game)
+                self.game.update()
 
-            if decision == 1:  # AI moves up
-                self.game.move_right_paddle_up()
-            elif decision == 2:  # AI moves down
-                self.game.move_right_paddle_down()
+                output = net.activate((self.game.paddleR.y, abs(self.game.paddleR.x - self.game.ball.x), self.game.ball.y))
+                decision = output.index(max(output))
 
-            keys = pygame.key.get_pressed()
-            if keys[pygame.K_w]:
-                self.game.move_left_paddle_up()
-            elif keys[pygame.K_s]:
-                self.game.move_left_paddle_down()
+                if decision == 1:  # AI moves up
+                    self.game.move_right_paddle_up()
+                elif decision == 2:  # AI moves down
+                    self.game.move_right_paddle_down()
 
-            self.window.fill(BLACK)
-            draw_scores(self.window, self.game)
-            draw_net(self.window, self.game)
-            draw_game(self.window, self.game)
-            pygame.display.flip()
+                if keys[pygame.K_w]:
+                    self.game.move_left_paddle_up()
+                elif keys[pygame.K_s]:
+                    self.game.move_left_paddle_down()
+
+            pygame.display.update(renderer.draw(self.game, previous.interpolate(self.game, timestep.alpha)))
 
     def train_ai(
         self,
-        genome1: neat.genome.DefaultGenome,
-        genome2: neat.genome.DefaultGenome,
-        neat_config: neat.Config,
+        net1: CompiledNetwork,
+        net2: CompiledNetwork,
         draw: bool = DRAW,
-    ):
-        net1 = neat.nn.FeedForwardNetwork.create(genome1, neat_config)
-        net2 = neat.nn.FeedForwardNetwork.create(genome2, neat_config)
-        self.genome1 = genome1
-        self.genome2 = genome2
-        start_time = time.time()
+        max_speed: bool = MAX_SPEED,
+        fast_forward: bool = FAST_FORWARD,
+    ) -> tuple[float, float]:
+        frames = 0
+        still_frames = 0  # frames in a row in which neither paddle moved
         run = True
         max_hits = 50
 
+        # with max_speed the loop is pure simulation, otherwise the window is serviced every TRAINING_SUBSTEPS frames
+        windowed = self.window is not None and not max_speed
+        fast_forward = fast_forward and not windowed
+
         while run:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        run = False
-                        break
+            if windowed and frames % TRAINING_SUBSTEPS == 0:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        sys.exit()
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            run = False
+                            break
 
             self.game.update()
+            paddles = (self.game.paddleL.y, self.game.paddleR.y)
             self._move_ai_paddles(net1, net2)
+            frames += 1
 
-            if draw:
+            if draw and windowed and frames % TRAINING_SUBSTEPS == 0:
                 self.window.fill(BLACK)
                 draw_scores(self.window, self.game)
                 draw_net(self.window, self.game)
@@ -99,25 +135,103 @@ class PongAi:
                 draw_game(self.window, self.game)
                 pygame.display.flip()
 
-            duration = time.time() - start_time
+            duration = frames / FPS  # simulated seconds, so fitness doesn't depend on how fast the machine is
             if self.game.score_left == 1 or self.game.score_right == 1 or self.game.hits_left >= max_hits:
                 self._calculate_fitness(duration)
                 break
 
+            still_frames = still_frames + 1 if paddles == (self.game.paddleL.y, self.game.paddleR.y) else 0
+            if fast_forward and still_frames >= 2:  # likely to stay put a while longer
+                frames += self._fast_forward(net1, net2)
+
+        return self.fitness1, self.fitness2
+
+    def _fast_forward(self, net1: CompiledNetwork, net2: CompiledNetwork) -> int:
+        """Play the coming frames in which neither paddle moves in one go, returning how many were played
+
+        The ball's path is worked out up to the next paddle hit or goal, taking the paddles to stay put, and both
+        networks are activated on all of its frames at once. The frames up to the first decision that moves a paddle
+        are then applied with the same state and fitness as playing them one by one.
+        """
+        # the predicted time until the ball reaches the paddle it flies towards bounds the path, no need to trace short ones
+        game = self.game
+        plane_x = game.paddleL.x + game.paddleL.width + game.ball.radius if game.ball.x_velocity < 0 else game.paddleR.x - game.ball.radius
+        arrival = intercept(game, plane_x)
+        if arrival is None or arrival[0] < MIN_FAST_FORWARD:
+            return 0
+
+        path = self._ball_path(MAX_FAST_FORWARD)
+        if len(path) < MIN_FAST_FORWARD:
+            return 0
+
+        ticks = len(path)
+        stays = []
+        for net, paddle in ((net1, self.game.paddleL), (net2, self.game.paddleR)):
+            inputs = np.column_stack((np.full(len(path), paddle.y), np.abs(paddle.x - path[:, 0]), path[:, 1]))
+            decisions = net.activate_batch(inputs).argmax(axis=1)
+            can_move_up = paddle.y - paddle.VELOCITY >= 0
+            can_move_down = paddle.y + paddle.VELOCITY <= self.game.game_area.height - paddle.height
+            moves = ((decisions == 1) & can_move_up) | ((decisions == 2) & can_move_down)
+            stays.append(decisions == 0)
+            if moves.any():
+                ticks = min(ticks, int(moves.argmax()))
+
+        if ticks:
+            # a paddle that doesn't move stayed or was stopped at the edge, the penalties are taken off one by one
+            penalties = [np.where(stay[:ticks], -0.01, -1.0) for stay in stays]
+            self.fitness1 = float(np.add.accumulate(np.concatenate(([self.fitness1], penalties[0])))[-1])
+            self.fitness2 = float(np.add.accumulate(np.concatenate(([self.fitness2], penalties[1])))[-1])
+            ball = self.game.ball
+            ball.x, ball.y, ball.x_velocity, ball.y_velocity = path[ticks - 1].tolist()
+        return ticks
+
+    def _ball_path(self, max_ticks: int) -> np.ndarray:
+        # ball x, y and velocities after each coming tick until it would hit a paddle or score, leaving the game as it was
+        ball = self.game.ball
+        start = (ball.x, ball.y, ball.x_velocity, ball.y_velocity)
+        hits = (self.game.hits_left, self.game.hits_right)
+        path = []
+        length = 0
+
+        while length < max_ticks:
+            # straight flight, summed up tick by tick like Ball.move, accumulate adds one step after the other
+            free = min(collision_free_ticks(self.game), max_ticks - length)
+            if free:
+                steps = np.empty((free + 1, 4))
+                steps[0, :2] = ball.x, ball.y
+                steps[:, 2:] = steps[1:, :2] = ball.x_velocity, ball.y_velocity
+                steps[:, :2] = np.add.accumulate(steps[:, :2])
+                path.append(steps[1:])
+                length += free
+                ball.x, ball.y = steps[-1, :2].tolist()
+                if length == max_ticks:
+                    break
+
+            # a tick that may bounce off a wall is left to the game's own physics
+            self.game.move_ball()
+            if (self.game.hits_left, self.game.hits_right) != hits or not 0 <= ball.x <= self.game.game_area.width:
+                break
+            path.append(np.array([[ball.x, ball.y, ball.x_velocity, ball.y_velocity]]))
+            length += 1
+
+        ball.x, ball.y, ball.x_velocity, ball.y_velocity = start
+        self.game.hits_left, self.game.hits_right = hits
+        return np.concatenate(path) if path else np.empty((0, 4))
+
     def _calculate_fitness(self, duration: float):
-        self.genome1.fitness += self.game.hits_left + duration
-        self.genome2.fitness += self.game.hits_right + duration
+        self.fitness1 += self.game.hits_left + duration
+        self.fitness2 += self.game.hits_right + duration
 
-    def _move_ai_paddles(self, net1: neat.nn.FeedForwardNetwork, net2: neat.nn.FeedForwardNetwork):
-        players = [(self.genome1, net1, self.game.paddleL, True), (self.genome2, net2, self.game.paddleR, False)]
+    def _move_ai_paddles(self, net1: CompiledNetwork, net2: CompiledNetwork):
+        players = [(net1, self.game.paddleL, True), (net2, self.game.paddleR, False)]
 
-        for genome, net, paddle, left in players:
+        for net, paddle, left in players:
             output = net.activate((paddle.y, abs(paddle.x - self.game.ball.x), self.game.ball.y))
             decision = output.index(max(output))
 
             valid = True
             if decision == 0:  # Don't move
-                genome.fitness -= 0.01  # we want to discourage this
+                self._punish(left, 0.01)  # we want to discourage this
             elif decision == 1:  # Move up
                 if left:
                     valid = self.game.move_left_paddle_up()
@@ -130,36 +244,230 @@ class PongAi:
                     valid = self.game.move_right_paddle_down()
 
             if not valid:  # If the movement makes the paddle go off the screen punish the AI
-                genome.fitness -= 1
+                self._punish(left, 1)
+
+    def _punish(self, left: bool, amount: float):
+        if left:
+            self.fitness1 -= amount
+        else:
+            self.fitness2 -= amount
+
+
+class ParallelEvaluator:
+    """Plays the matches of a generation headless across a pool of worker processes, seeded like eval_genomes (python -m pong.check)"""
+
+    def __init__(self, neat_config: neat.Config, workers: int | None = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = Pool(self.workers, initializer=_init_worker, initargs=(neat_config,))
+        self.calls = 0  # tells the workers when the genomes they compiled are no longer played
+
+    def eval_genomes(self, genomes: list[tuple[int, neat.genome.DefaultGenome]], neat_config: neat.Config):
+        pairs = _match_pairs(len(genomes))
+        base_seed = random.randrange(2**32)
+        genome_pairs = [(genomes[i][1], genomes[j][1]) for i, j in pairs]
+        results = self.play_matches(genome_pairs, neat_config, [_match_seed(base_seed, i, j) for i, j in pairs])
+        _merge_fitness(genomes, pairs, results)
+
+    def play_matches(
+        self,
+        genome_pairs: list[tuple[neat.genome.DefaultGenome, neat.genome.DefaultGenome]],
+        neat_config: neat.Config,
+        seeds: list[int | str | None],
+    ) -> list[tuple[float, float]]:
+        self.calls += 1
+        matches = [(genome1, genome2, seed, self.calls) for (genome1, genome2), seed in zip(genome_pairs, seeds)]
+        return self.pool.starmap(_play_worker_match, matches, chunksize=max(1, len(matches) // (self.workers * 4)))
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+
+def play_match(
+    net1: CompiledNetwork,
+    net2: CompiledNetwork,
+    seed: int | str | None = None,
+    window: pygame.Surface | None = None,
+) -> tuple[float, float]:
+    pong = PongAi(window, SCREEN_WIDTH, SCREEN_HEIGHT, seed)
+    return pong.train_ai(net1, net2)
+
+
+def play_matches(
+    genome_pairs: list[tuple[neat.genome.DefaultGenome, neat.genome.DefaultGenome]],
+    neat_config: neat.Config,
+    seeds: list[int | str | None],
+) -> list[tuple[float, float]]:
+    """Play the matches headless one after the other, the serial counterpart of play_matches_batch"""
+    networks = compile_networks((genome for pair in genome_pairs for genome in pair), neat_config)
+    return [play_match(networks[genome1.key], networks[genome2.key], seed) for (genome1, genome2), seed in zip(genome_pairs, seeds)]
 
 
 def eval_genomes(genomes: list[tuple[int, neat.genome.DefaultGenome]], neat_config: neat.Config):
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-    for i, (_, genome1) in enumerate(genomes):
-        print(f"Progress: {round(i / len(genomes) * 100)}%", end="\r", flush=True)
-        genome1.fitness = 0
-        for _, genome2 in genomes[min(i + 1, len(genomes) - 1) :]:
-            genome2.fitness = 0 if genome2.fitness is None else genome2.fitness
-            pong = PongAi(screen, SCREEN_WIDTH, SCREEN_HEIGHT)
-            pong.train_ai(genome1, genome2, neat_config)
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)) if DRAW and not MAX_SPEED else None
+    pairs = _match_pairs(len(genomes))
+    base_seed = random.randrange(2**32)
+    networks = compile_networks((genome for _, genome in genomes), neat_config)
+    results = []
+    for i, j in pairs:
+        if i == j or j == i + 1:  # once per genome, at its first match
+            print(f"Progress: {round(i / len(genomes) * 100)}%", end="\r", flush=True)
+        results.append(play_match(networks[genomes[i][1].key], networks[genomes[j][1].key], _match_seed(base_seed, i, j), screen))
+    _merge_fitness(genomes, pairs, results)
+
+
+def play_matches_batch(
+    genome_pairs: list[tuple[neat.genome.DefaultGenome, neat.genome.DefaultGenome]],
+    neat_config: neat.Config,
+    seeds: list[int | str | None],
+) -> list[tuple[float, float]]:
+    """Play many matches at once on a BatchGame, with the same results as play_matches"""
+    games = BatchGame(len(genome_pairs), SCREEN_WIDTH, SCREEN_HEIGHT, seeds)
+    # one network per game and side, the left networks of all games, then the right ones, activated in a single call
+    networks = compile_networks((genome for pair in genome_pairs for genome in pair), neat_config)
+    nets = NetworkStack([networks[genome1.key] for genome1, _ in genome_pairs] + [networks[genome2.key] for _, genome2 in genome_pairs])
+    fitness1 = np.zeros(games.num_games)
+    fitness2 = np.zeros(games.num_games)
+    frames = np.zeros(games.num_games, dtype=np.int64)
+    active = np.ones(games.num_games, dtype=bool)
+    matches = np.arange(games.num_games)  # the match each game of the batch is, the batch shrinks as matches end
+    results = np.zeros((games.num_games, 2))
+    max_hits = 50
+
+    while active.any():
+        if np.count_nonzero(active) <= BATCH_MIN_GAMES:
+            for match in matches[active]:
+                genome1, genome2 = genome_pairs[match]
+                results[match] = play_match(networks[genome1.key], networks[genome2.key], seeds[match])
+            break
+
+        # most matches end early, once half of the batch is done the rest carry on without the finished ones
+        if np.count_nonzero(active) * 2 <= len(active):
+            playing = np.flatnonzero(active)
+            games, nets = games.subset(playing), nets.subset(np.concatenate((playing, playing + len(active))))
+            fitness1, fitness2, frames, matches = fitness1[playing], fitness2[playing], frames[playing], matches[playing]
+            active = np.ones(len(playing), dtype=bool)
+
+        games.update(active)
+
+        # finished games are evaluated too, their decisions are masked out below
+        inputs = np.column_stack((
+            np.concatenate((games.paddle_left_y, games.paddle_right_y)),
+            np.concatenate((np.abs(games.paddle_left_x - games.ball_x), np.abs(games.paddle_right_x - games.ball_x))),
+            np.concatenate((games.ball_y, games.ball_y)),
+        ))
+        decisions = nets.activate(inputs).argmax(axis=1)
+        left_decisions, right_decisions = decisions[: games.num_games], decisions[games.num_games :]
+
+        left_valid, right_valid = games.move_paddles(left_decisions, right_decisions, active)
+        fitness1[active & (left_decisions == 0)] -= 0.01
+        fitness2[active & (right_decisions == 0)] -= 0.01
+        fitness1[active & ~left_valid] -= 1
+        fitness2[active & ~right_valid] -= 1
+        frames[active] += 1
+
+        done = active & ((games.score_left == 1) | (games.score_right == 1) | (games.hits_left >= max_hits))
+        duration = frames[done] / FPS
+        fitness1[done] += games.hits_left[done] + duration
+        fitness2[done] += games.hits_right[done] + duration
+        results[matches[done], 0] = fitness1[done]
+        results[matches[done], 1] = fitness2[done]
+        active &= ~done
+
+    return [tuple(result) for result in results.tolist()]
+
+
+def eval_genomes_batch(genomes: list[tuple[int, neat.genome.DefaultGenome]], neat_config: neat.Config):
+    """Same fitness as eval_genomes, with all of a generation's matches played together on one BatchGame"""
+    pairs = _match_pairs(len(genomes))
+    base_seed = random.randrange(2**32)
+    genome_pairs = [(genomes[i][1], genomes[j][1]) for i, j in pairs]
+    results = play_matches_batch(genome_pairs, neat_config, [_match_seed(base_seed, i, j) for i, j in pairs])
+    _merge_fitness(genomes, pairs, results)
+
+
+def _match_pairs(num_genomes: int) -> list[tuple[int, int]]:
+    # every genome plays every later genome, the last one plays itself
+    return [(i, j) for i in range(num_genomes) for j in range(min(i + 1, num_genomes - 1), num_genomes)]
+
+
+def compile_networks(
+    genomes: Iterable[neat.genome.DefaultGenome],
+    neat_config: neat.Config,
+    networks: dict[int, CompiledNetwork] | None = None,
+) -> dict[int, CompiledNetwork]:
+    """Networks by genome key, each genome compiled once however many matches it plays, added to networks if given"""
+    networks = {} if networks is None else networks
+    for genome in genomes:
+        if genome.key not in networks:
+            networks[genome.key] = CompiledNetwork.create(genome, neat_config)
+    return networks
+
+
+def _match_seed(base_seed: int, i: int, j: int) -> str:
+    return f"{base_seed}:{i}:{j}"
+
+
+def _merge_fitness(
+    genomes: list[tuple[int, neat.genome.DefaultGenome]],
+    pairs: list[tuple[int, int]],
+    results: list[tuple[float, float]],
+):
+    # a genome is scored on the matches it plays as the left paddle (both sides when it plays itself)
+    for _, genome in genomes:
+        genome.fitness = 0
+    for (i, j), (fitness1, fitness2) in zip(pairs, results):
+        genomes[i][1].fitness += fitness1
+        if i == j:
+            genomes[i][1].fitness += fitness2
+
+
+def _init_worker(neat_config: neat.Config):
+    global _worker_config
+    _worker_config = neat_config
+
+
+def _play_worker_match(genome1: neat.genome.DefaultGenome, genome2: neat.genome.DefaultGenome, seed: str, call: int) -> tuple[float, float]:
+    global _worker_call
+    if call != _worker_call:
+        _worker_networks.clear()
+        _worker_call = call
+    compile_networks((genome1, genome2), _worker_config, _worker_networks)
+    return play_match(_worker_networks[genome1.key], _worker_networks[genome2.key], seed)
 
 
 def run_neat(
     num_generations: int,
     neat_config: neat.Config,
     checkpoint_dir: str = CHECKPOINT_DIR,
-    checkpoint: str | None = None,
+    resume: bool = True,
+    workers: int = 1,
+    batch: bool = False,
+    league: bool = False,
 ):
-    if checkpoint:
-        p = neat.Checkpointer.restore_checkpoint(os.path.join(checkpoint_dir, checkpoint))
-    else:
+    """Train for num_generations, every genome playing every other one, or a fixed number of opponents in a league"""
+    checkpoints = CheckpointStore(checkpoint_dir, resume=resume)
+    p = checkpoints.restore() if resume else None
+    if p is None:
         p = neat.Population(neat_config)
 
     p.add_reporter(neat.StdOutReporter(True))
     stats = neat.StatisticsReporter()
     p.add_reporter(stats)
-    p.add_reporter(neat.Checkpointer(1, filename_prefix=f"{checkpoint_dir}neat-checkpoint-"))
-    winner = p.run(eval_genomes, num_generations)
+    p.add_reporter(checkpoints)
+
+    if workers > 1:
+        evaluator = ParallelEvaluator(neat_config, workers)
+        try:
+            winner = p.run(League(evaluator.play_matches).eval_genomes if league else evaluator.eval_genomes, num_generations)
+        finally:
+            evaluator.close()
+    elif league:
+        winner = p.run(League(play_matches_batch if batch else play_matches).eval_genomes, num_generations)
+    elif batch:
+        winner = p.run(eval_genomes_batch, num_generations)
+    else:
+        winner = p.run(eval_genomes, num_generations)
 
     with open(BEST_PICKLE, "wb") as f:
         pickle.dump(winner, f)
@@ -168,7 +476,7 @@ def run_neat(
 def test_best_network(screen: pygame.Surface, neat_config: neat.Config):
     with open(BEST_PICKLE, "rb") as f:
         winner = pickle.load(f)
-    winner_net = neat.nn.FeedForwardNetwork.create(winner, neat_config)
+    winner_net = CompiledNetwork.create(winner, neat_config)
     pong = PongAi(screen, screen.get_width(), screen.get_height())
     pong.test_ai(winner_net)
 
@@ -176,19 +484,13 @@ def test_best_network(screen: pygame.Surface, neat_config: neat.Config):
 if __name__ == "__main__":
     pygame.display.set_caption("Ai Pong")
 
-    if not os.path.isdir(CHECKPOINT_DIR):
-        os.makedirs(CHECKPOINT_DIR)
-
     local_dir = os.path.dirname(__file__)
     config_path = os.path.join(local_dir, "config.txt")
     config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction, neat.DefaultSpeciesSet, neat.DefaultStagnation, config_path)
 
-    checkpoints = os.listdir(CHECKPOINT_DIR)
-    last_checkpoint = max(checkpoints, key=lambda x: int(x.split("-")[-1]))
-
     win = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-    run_neat(5, config, checkpoint=last_checkpoint)
+    run_neat(5, config, workers=os.cpu_count(), league=True)
     test_best_network(win, config)
 
     pygame.quit()
@@ -0,0 +1,198 @@
+import math
+import random
+
+import numpy as np
+
+try:
+    from game_logic import Game, Paddle, Ball
+    from collision import sweep_faces
+except ImportError:
+    from .game_logic import Game, Paddle, Ball
+    from .collision import sweep_faces
+
+
+class BatchGame:
+    """Many Pong games stepped at once on NumPy arrays, each like a Game with the same seed (python -m pong.check)
+
+    Methods take an optional active mask, games outside it are left untouched.
+    """
+
+    def __init__(self, num_games: int, width: int, height: int, seeds: list[int | str | None] | None = None):
+        template = Game(width, height)
+        self.num_games = num_games
+        self.game_area = template.game_area
+        self.paddle_width = template.paddleL.width
+        self.paddle_height = template.paddleL.height
+        self.paddle_left_x = template.paddleL.x
+        self.paddle_right_x = template.paddleR.x
+        self.ball_radius = template.ball.radius
+        self.random = [random.Random(seed) for seed in (seeds if seeds is not None else [None] * num_games)]
+
+        self.ball_x = np.full(num_games, template.ball.x, dtype=np.float64)
+        self.ball_y = np.full(num_games, template.ball.y, dtype=np.float64)
+        self.ball_x_velocity = np.zeros(num_games, dtype=np.float64)
+        self.ball_y_velocity = np.zeros(num_games, dtype=np.float64)
+        self.paddle_left_y = np.full(num_games, template.paddleL.y, dtype=np.float64)
+        self.paddle_right_y = np.full(num_games, template.paddleR.y, dtype=np.float64)
+        self.score_left = np.zeros(num_games, dtype=np.int64)
+        self.score_right = np.zeros(num_games, dtype=np.int64)
+        self.hits_left = np.zeros(num_games, dtype=np.int64)
+        self.hits_right = np.zeros(num_games, dtype=np.int64)
+
+        self._set_ball_velocity(np.arange(num_games))
+
+    def subset(self, games: np.ndarray) -> "BatchGame":
+        """BatchGame of only the given games, in that order, each carrying on exactly where it is"""
+        batch = object.__new__(BatchGame)
+        batch.__dict__.update(self.__dict__)
+        batch.num_games = len(games)
+        batch.random = [self.random[game] for game in games]
+        for name in _GAME_ARRAYS:
+            setattr(batch, name, getattr(self, name)[games])
+        return batch
+
+    @property
+    def total_hits(self) -> np.ndarray:
+        return self.hits_left + self.hits_right
+
+    @property
+    def game_over(self) -> np.ndarray:
+        return (self.score_left >= Game.WINNING_SCORE) | (self.score_right >= Game.WINNING_SCORE)
+
+    def update(self, active: np.ndarray | None = None):
+        active = self._active(active)
+        self.move_ball(active)
+        self.check_goal(active)
+
+    def move_paddles(self, left_decisions: np.ndarray, right_decisions: np.ndarray, active: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Apply a decision per game and paddle (0 stay, 1 up, 2 down), returning whether each move stayed on screen"""
+        active = self._active(active)
+        self.paddle_left_y, left_valid = self._move_paddle(self.paddle_left_y, left_decisions, active)
+        self.paddle_right_y, right_valid = self._move_paddle(self.paddle_right_y, right_decisions, active)
+        return left_valid, right_valid
+
+    def move_ball(self, active: np.ndarray | None = None):
+        """Move the balls one tick, bouncing them off walls and paddles at the exact time they touch them"""
+        active = self._active(active)
+        remaining = np.where(active, 1.0, 0.0)
+        bouncing = active
+
+        for _ in range(Game.MAX_BOUNCES):
+            t, obstacle = self._next_collision(remaining)
+            colliding = bouncing & (obstacle != _NONE)
+            if not colliding.any():
+                break
+            self._move(colliding, t)
+            remaining = np.where(colliding, remaining - t, remaining)
+
+            hit_left = colliding & (obstacle == _LEFT_PADDLE)
+            hit_right = colliding & (obstacle == _RIGHT_PADDLE)
+            self._bounce_off_paddle(hit_left, self.paddle_left_y)
+            self._bounce_off_paddle(hit_right, self.paddle_right_y)
+            self.hits_left += hit_left
+            self.hits_right += hit_right
+            bounce = colliding & (obstacle == _WALL)
+            self.ball_y_velocity = np.where(bounce, self.ball_y_velocity * -1, self.ball_y_velocity)
+            bouncing = colliding
+
+        self._move(active, remaining)
+
+    def check_goal(self, active: np.ndarray | None = None):
+        active = self._active(active)
+        goal_right = active & (self.ball_x < 0)
+        goal_left = active & ~goal_right & (self.ball_x > self.game_area.width)
+        self.score_right += goal_right
+        self.score_left += goal_left
+
+        scored = np.flatnonzero(goal_right | goal_left)
+        if scored.size:
+            self.reset_ball(scored)
+            self.reset_paddles(scored)
+
+    def reset_ball(self, games: np.ndarray):
+        self.ball_x[games] = self.game_area.width // 2
+        self.ball_y[games] = self.game_area.height // 2
+        self._set_ball_velocity(games)
+
+    def reset_paddles(self, games: np.ndarray):
+        self.paddle_left_y[games] = self.game_area.height // 2 - self.paddle_height // 2
+        self.paddle_right_y[games] = self.game_area.height // 2 - self.paddle_height // 2
+
+    def _active(self, active: np.ndarray | None) -> np.ndarray:
+        return np.ones(self.num_games, dtype=bool) if active is None else active
+
+    def _move_paddle(self, paddle_y: np.ndarray, decisions: np.ndarray, active: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        up = active & (decisions == 1)
+        down = active & (decisions == 2)
+        can_move_up = paddle_y - Paddle.VELOCITY >= 0
+        can_move_down = paddle_y + Paddle.VELOCITY <= self.game_area.height - self.paddle_height
+        paddle_y = np.where(up & can_move_up, paddle_y - Paddle.VELOCITY, paddle_y)
+        paddle_y = np.where(down & can_move_down, paddle_y + Paddle.VELOCITY, paddle_y)
+        valid = ~((up & ~can_move_up) | (down & ~can_move_down))
+        return paddle_y, valid
+
+    def _move(self, games: np.ndarray, ticks: np.ndarray):
+        self.ball_x = np.where(games, self.ball_x + self.ball_x_velocity * ticks, self.ball_x)
+        self.ball_y = np.where(games, self.ball_y + self.ball_y_velocity * ticks, self.ball_y)
+
+    def _next_collision(self, remaining: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # earliest wall or paddle each ball touches within the remaining part of the tick, like Game._next_collision
+        x, y, dx, dy = self.ball_x, self.ball_y, self.ball_x_velocity, self.ball_y_velocity
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_wall = np.where(dy > 0, (self.game_area.height - self.ball_radius - y) / dy, np.where(dy < 0, (self.ball_radius - y) / dy, np.inf))
+        left = dx < 0
+        face_x = np.where(left, self.paddle_left_x + self.paddle_width, self.paddle_right_x)
+        paddle_y = np.where(left, self.paddle_left_y, self.paddle_right_y)
+        t_paddle = sweep_faces(x, y, dx, dy, self.ball_radius, face_x, paddle_y, paddle_y + self.paddle_height, remaining)
+
+        best_t = remaining
+        obstacle = np.full(self.num_games, _NONE)
+        for t, kind in ((t_wall, _WALL), (t_paddle, np.where(left, _LEFT_PADDLE, _RIGHT_PADDLE))):
+            t = np.maximum(t, 0.0)  # a ball already past a wall bounces straight away
+            better = (t <= remaining) & ((obstacle == _NONE) | (t < best_t))
+            best_t = np.where(better, t, best_t)
+            obstacle = np.where(better, kind, obstacle)
+        return best_t, obstacle
+
+    def _bounce_off_paddle(self, hit: np.ndarray, paddle_y: np.ndarray):
+        self.ball_x_velocity = np.where(hit, self.ball_x_velocity * -1, self.ball_x_velocity)
+
+        # Adjust ball velocity based on paddle position, a ball caught by a corner bounces like one at the end
+        middle_y = paddle_y + self.paddle_height / 2
+        y_difference = middle_y - np.minimum(np.maximum(self.ball_y, paddle_y), paddle_y + self.paddle_height)
+        reduction_factor = (self.paddle_height / 2) / Ball.MAX_VELOCITY
+        self.ball_y_velocity = np.where(hit, (y_difference / reduction_factor) * -1, self.ball_y_velocity)
+
+    def _set_ball_velocity(self, games: np.ndarray):
+        # only runs for new games and goals, each game draws from its own generator like Game does
+        for game in games:
+            angle = _get_random_angle(self.random[game], -30, 30, [0])
+            x_vel = abs(math.cos(angle) * Ball.MAX_VELOCITY)
+            y_vel = math.sin(angle) * Ball.MAX_VELOCITY
+            self.ball_x_velocity[game] = -x_vel if self.ball_x_velocity[game] > 0 else x_vel
+            self.ball_y_velocity[game] = y_vel
+
+
+# the per-game state, see BatchGame.subset
+_GAME_ARRAYS = (
+    "ball_x",
+    "ball_y",
+    "ball_x_velocity",
+    "ball_y_velocity",
+    "paddle_left_y",
+    "paddle_right_y",
+    "score_left",
+    "score_right",
+    "hits_left",
+    "hits_right",
+)
+
+# what a ball collides with, see BatchGame._next_collision
+_NONE, _WALL, _LEFT_PADDLE, _RIGHT_PADDLE = range(4)
+
+
+def _get_random_angle(rng: random.Random, min_angle: int, max_angle: int, excluded: list[int]) -> float:
+    angle = 0
+    while angle in excluded:
+        angle = math.radians(rng.randrange(min_angle, max_angle))
+    return angle
@@ -0,0 +1,144 @@
+"""Checks that the faster training paths give the same results as plain serial play
+
+    python -m pong.check
+    python -m pong.check --genomes 30 --seed 3
+
+Every check runs the same seeded games both ways and compares the results for equality, not within a tolerance.
+"""
+
+import os
+import copy
+import random
+import argparse
+
+import neat
+import numpy as np
+
+try:
+    from ai import ParallelEvaluator, play_matches, play_matches_batch
+    from game_logic import Game
+    from batch_logic import BatchGame
+    from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+except ImportError:
+    from .ai import ParallelEvaluator, play_matches, play_matches_batch
+    from .game_logic import Game
+    from .batch_logic import BatchGame
+    from .constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def evolved_genomes(neat_config: neat.Config, count: int, seed: int = 0) -> list[neat.genome.DefaultGenome]:
+    """Genomes of a new population mutated a random number of times each, so their networks differ in shape"""
+    random.seed(seed)
+    genomes = list(neat.Population(neat_config).population.values())[:count]
+    for genome in genomes:
+        for _ in range(random.randrange(20)):
+            genome.mutate(neat_config.genome_config)
+    return genomes
+
+
+def league_matches(genomes: list[neat.genome.DefaultGenome], opponents: int, seed: int = 0) -> tuple[list[tuple], list[str]]:
+    rng = random.Random(seed)
+    pairs = [(genome, rng.choice(genomes)) for genome in genomes for _ in range(opponents)]
+    return pairs, [f"{seed}:check:{n}" for n in range(len(pairs))]
+
+
+def check_batch(genomes: list[neat.genome.DefaultGenome], neat_config: neat.Config, seed: int = 0) -> bool:
+    """Whether play_matches_batch scores every match like play_matches"""
+    pairs, seeds = league_matches(genomes, 4, seed)
+    return play_matches_batch(pairs, neat_config, seeds) == play_matches(pairs, neat_config, seeds)
+
+
+def check_parallel(genomes: list[neat.genome.DefaultGenome], neat_config: neat.Config, workers: int, seed: int = 0) -> bool:
+    """Whether a ParallelEvaluator scores every match like play_matches
+
+    The second call plays mutated copies of the genomes under the same keys, which the workers must compile anew.
+    """
+    mutated = copy.deepcopy(genomes)
+    for genome in mutated:
+        genome.mutate(neat_config.genome_config)
+    evaluator = ParallelEvaluator(neat_config, workers)
+    try:
+        for call_genomes in (genomes, mutated):
+            pairs, seeds = league_matches(call_genomes, 4, seed)
+            if evaluator.play_matches(pairs, neat_config, seeds) != play_matches(pairs, neat_config, seeds):
+                return False
+    finally:
+        evaluator.close()
+    return True
+
+
+def check_games(num_games: int, frames: int, seed: int = 0) -> bool:
+    """Whether a BatchGame keeps every ball, paddle and score equal to a Game per seed, frame after frame
+
+    The paddles follow the ball part of the time and move at random otherwise, so there are both rallies and points.
+    """
+    seeds = [f"{seed}:game:{n}" for n in range(num_games)]
+    games = [Game(SCREEN_WIDTH, SCREEN_HEIGHT, game_seed) for game_seed in seeds]
+    batch = BatchGame(num_games, SCREEN_WIDTH, SCREEN_HEIGHT, seeds)
+    rng = np.random.default_rng(seed)
+
+    for _ in range(frames):
+        for game in games:
+            game.update()
+        batch.update()
+
+        decisions = []
+        for paddle_y in (batch.paddle_left_y, batch.paddle_right_y):
+            follow = np.where(batch.ball_y < paddle_y + batch.paddle_height / 2, 1, 2)
+            decisions.append(np.where(rng.random(num_games) < 0.4, follow, rng.integers(3, size=num_games)))
+        for game, left, right in zip(games, *decisions):
+            for decision, up, down in ((left, game.move_left_paddle_up, game.move_left_paddle_down), (right, game.move_right_paddle_up, game.move_right_paddle_down)):
+                if decision == 1:
+                    up()
+                elif decision == 2:
+                    down()
+        batch.move_paddles(*decisions)
+
+        state = [
+            (game.ball.x, game.ball.y, game.ball.x_velocity, game.ball.y_velocity, game.paddleL.y, game.paddleR.y, game.score_left, game.score_right, game.hits_left, game.hits_right)
+            for game in games
+        ]
+        batch_state = zip(
+            batch.ball_x.tolist(),
+            batch.ball_y.tolist(),
+            batch.ball_x_velocity.tolist(),
+            batch.ball_y_velocity.tolist(),
+            batch.paddle_left_y.tolist(),
+            batch.paddle_right_y.tolist(),
+            batch.score_left.tolist(),
+            batch.score_right.tolist(),
+            batch.hits_left.tolist(),
+            batch.hits_right.tolist(),
+        )
+        if state != list(batch_state):
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Pong's batch and parallel training to serial play")
+    parser.add_argument("--genomes", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=2, help="processes of the ParallelEvaluator")
+    parser.add_argument("--games", type=int, default=50, help="games stepped side by side by check_games")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config_path = os.path.join(os.path.dirname(__file__), "config.txt")
+    neat_config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction, neat.DefaultSpeciesSet, neat.DefaultStagnation, config_path)
+    genomes = evolved_genomes(neat_config, args.genomes, args.seed)
+
+    checks = {
+        "BatchGame": lambda: check_games(args.games, args.frames, args.seed),
+        "play_matches_batch": lambda: check_batch(genomes, neat_config, args.seed),
+        "ParallelEvaluator": lambda: check_parallel(genomes, neat_config, args.workers, args.seed),
+    }
+    failed = [name for name, check in checks.items() if not check()]
+    for name in failed:
+        print(f"{name} differs from serial play")
+    print(f"{len(checks) - len(failed)} of {len(checks)} checks passed")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Checkpoints of a NEAT run
+
+Like neat.Checkpointer, the state at the end of every generation is pickled, but each file is gzip compressed and
+written to a temporary file that replaces the real one only once it's complete, so a crash never leaves a broken
+checkpoint behind. Only the last few checkpoints written and the one of the generation with the best genome so far are
+kept. manifest.json lists them in the order they were written, so the latest is found without going through the
+directory:
+
+    {"latest": 41, "best": {"generation": 37, "fitness": 153.2}, "checkpoints": {"37": "generation-37.pkl.gz", ...}}
+"""
+
+import os
+import copy
+import gzip
+import json
+import pickle
+import random
+import tempfile
+
+import neat
+
+try:
+    from constants import CHECKPOINT_DIR, KEEP_CHECKPOINTS
+except ImportError:
+    from .constants import CHECKPOINT_DIR, KEEP_CHECKPOINTS
+
+
+MANIFEST = "manifest.json"
+
+
+class CheckpointStore(neat.reporting.BaseReporter):
+    """Reporter saving a checkpoint at the end of every generation, restore resumes from one"""
+
+    def __init__(self, directory: str = CHECKPOINT_DIR, keep: int = KEEP_CHECKPOINTS, resume: bool = True):
+        if keep < 1:
+            raise ValueError("keep must be at least 1, a run resumes from the latest checkpoint")
+        self.directory = directory
+        self.keep = keep
+        self.manifest = self._read_manifest()
+        # a new run starts a new manifest, the checkpoints of the old one are removed once the first new one is saved
+        self.stale: list[str] = [] if resume else list(self.manifest["checkpoints"].values())
+        if not resume:
+            self.manifest = self._new_manifest()
+        self.generation: int | None = None
+        self.best_genome: neat.genome.DefaultGenome | None = None  # best ever, loaded from its checkpoint when needed
+        self.improved = False  # whether the running generation found a new best genome
+
+    def restore(self, generation: int | None = None) -> neat.Population | None:
+        """Population to resume from, the latest one by default, or None when there is no checkpoint yet"""
+        if generation is None:
+            generation = self.manifest["latest"]
+        filename = self.manifest["checkpoints"].get(str(generation))
+        if filename is None:
+            return None
+
+        with gzip.open(os.path.join(self.directory, filename)) as f:
+            generation, config, population, species_set, random_state, best_genome = pickle.load(f)
+        random.setstate(random_state)
+        # saved at the end of the generation, the population is already the one bred for the next
+        p = neat.Population(config, (population, species_set, generation + 1))
+        p.best_genome = best_genome
+        return p
+
+    def start_generation(self, generation: int):
+        self.generation = generation
+
+    def post_evaluate(self, config: neat.Config, population: dict, species: neat.DefaultSpeciesSet, best_genome: neat.genome.DefaultGenome):
+        best = self.manifest["best"]
+        self.improved = best is None or best_genome.fitness > best["fitness"]
+        if self.improved:
+            self.best_genome = copy.deepcopy(best_genome)  # the genome itself is evaluated again next generation
+
+    def end_generation(self, config: neat.Config, population: dict, species_set: neat.DefaultSpeciesSet):
+        filename = f"generation-{self.generation}.pkl.gz"
+        data = (self.generation, config, population, species_set, random.getstate(), self._best_so_far())
+        self._write_atomic(filename, lambda f: f.write(gzip.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))))
+
+        checkpoints = self.manifest["checkpoints"]
+        checkpoints.pop(str(self.generation), None)  # a generation saved again after resuming from an earlier one is the newest
+        checkpoints[str(self.generation)] = filename
+        self.manifest["latest"] = self.generation
+        if self.improved:
+            self.manifest["best"] = {"generation": self.generation, "fitness": self.best_genome.fitness}
+
+        # keep the last few and the best, the files are only removed once the manifest no longer lists them
+        kept = list(checkpoints)[-self.keep :]
+        if self.manifest["best"] is not None:
+            kept.append(str(self.manifest["best"]["generation"]))
+        removed = [checkpoints.pop(generation) for generation in list(checkpoints) if generation not in kept]
+        self._write_atomic(MANIFEST, lambda f: f.write(json.dumps(self.manifest, indent=2).encode()))
+        removed += [filename for filename in self.stale if filename not in checkpoints.values()]
+        self.stale = []
+        for filename in removed:
+            try:
+                os.remove(os.path.join(self.directory, filename))
+            except FileNotFoundError:
+                pass
+
+    def _best_so_far(self) -> neat.genome.DefaultGenome | None:
+        # after resuming, the best genome is still in the checkpoint it was found in
+        best = self.manifest["best"]
+        if self.best_genome is None and best is not None:
+            with gzip.open(os.path.join(self.directory, self.manifest["checkpoints"][str(best["generation"])])) as f:
+                self.best_genome = pickle.load(f)[-1]
+        return self.best_genome
+
+    def _read_manifest(self) -> dict:
+        try:
+            with open(os.path.join(self.directory, MANIFEST)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return self._new_manifest()
+
+    @staticmethod
+    def _new_manifest() -> dict:
+        return {"latest": None, "best": None, "checkpoints": {}}
+
+    def _write_atomic(self, filename: str, write):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{filename}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, os.path.join(self.directory, filename))
+        except BaseException:
+            os.remove(temp_path)
+            raise
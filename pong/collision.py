@@ -0,0 +1,80 @@
+"""Swept collision of the ball with a paddle
+
+A ball moving (dx, dy) per tick touches a paddle's face when its center reaches the face moved out by the radius, or
+when the center comes within the radius of one of the face's two corners. Solving for that time instead of testing for
+overlap after the move means a ball can't pass through a paddle however fast it is.
+
+sweep_face works on plain floats for Game, sweep_faces on arrays for BatchGame (python -m pong.check).
+"""
+
+import math
+
+import numpy as np
+
+
+def sweep_face(x: float, y: float, dx: float, dy: float, radius: float, face_x: float, top: float, bottom: float, limit: float) -> float | None:
+    """Time in ticks, between 0 and limit, at which the ball touches the vertical face x = face_x from top to bottom
+
+    Only a ball in front of the face and moving towards it can touch it, otherwise None is returned.
+    """
+    if dx == 0:
+        return None
+    side = 1.0 if dx < 0 else -1.0  # the face looks towards +x when the ball comes from the right
+    gap = (x - face_x) * side - radius
+    if gap < 0:
+        return None
+    t = gap / abs(dx)
+    if t > limit:
+        return None
+
+    contact_y = y + dy * t
+    if top <= contact_y <= bottom:
+        return t
+
+    # the ball passes the face above or below it, it can still catch the nearer corner
+    corner_y = top if contact_y < top else bottom
+    t = _sweep_point(x - face_x, y - corner_y, dx, dy, radius)
+    if t is None or t > limit:
+        return None
+    return t
+
+
+def sweep_faces(x: np.ndarray, y: np.ndarray, dx: np.ndarray, dy: np.ndarray, radius: float, face_x: float, top: np.ndarray, bottom: np.ndarray, limit: np.ndarray) -> np.ndarray:
+    """sweep_face for arrays of balls and faces, with inf where the ball doesn't touch the face"""
+    side = np.where(dx < 0, 1.0, -1.0)
+    gap = (x - face_x) * side - radius
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_face = gap / np.abs(dx)
+    possible = (dx != 0) & (gap >= 0) & (t_face <= limit)
+
+    contact_y = y + dy * t_face
+    on_face = (top <= contact_y) & (contact_y <= bottom)
+
+    corner_y = np.where(contact_y < top, top, bottom)
+    t_corner = _sweep_points(x - face_x, y - corner_y, dx, dy, radius)
+    on_corner = ~on_face & (t_corner <= limit)
+
+    return np.where(possible & on_face, t_face, np.where(possible & on_corner, t_corner, np.inf))
+
+
+def _sweep_point(rx: float, ry: float, dx: float, dy: float, radius: float) -> float | None:
+    # first time the ball at (rx, ry) from a point comes within radius of it, |(rx, ry) + (dx, dy) t| = radius
+    a = dx * dx + dy * dy
+    b = rx * dx + ry * dy
+    c = rx * rx + ry * ry - radius * radius
+    if c < 0 or b >= 0:  # already touching or moving away
+        return None
+    discriminant = b * b - a * c
+    if discriminant < 0:
+        return None
+    return (-b - math.sqrt(discriminant)) / a
+
+
+def _sweep_points(rx: np.ndarray, ry: np.ndarray, dx: np.ndarray, dy: np.ndarray, radius: float) -> np.ndarray:
+    a = dx * dx + dy * dy
+    b = rx * dx + ry * dy
+    c = rx * rx + ry * ry - radius * radius
+    discriminant = b * b - a * c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (-b - np.sqrt(discriminant)) / a
+    return np.where((c >= 0) & (b < 0) & (discriminant >= 0), t, np.inf)
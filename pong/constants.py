@@ -1,9 +1,20 @@
 # note that changing game dimensions affects the ai.
 SCREEN_WIDTH = 700
 SCREEN_HEIGHT = 500
+FPS = 60  # physics ticks per second, also the simulated time base of training
+RENDER_FPS = 120  # frame rate cap of the windowed games, positions are interpolated between ticks
+MAX_SUBSTEPS = 8  # most physics ticks per rendered frame before the game slows down instead of stalling
+TRAINING_SUBSTEPS = 10  # frames simulated between event pumps when training with a window
 
 BEST_PICKLE = "pong/best.pickle"
 CHECKPOINT_DIR = "pong/checkpoints/"
+KEEP_CHECKPOINTS = 5  # the checkpoint of the best genome is kept as well
+
+LEAGUE_OPPONENTS = 8  # matches every genome plays per generation when training in a league
+HALL_OF_FAME_OPPONENTS = 2  # how many of those are against past champions
+HALL_OF_FAME_SIZE = 10
+INITIAL_RATING = 1000.0
+ELO_K = 32.0
 
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -1,18 +1,85 @@
+import os
+import sys
+
 import pygame
 
+try:
+    from common.text_cache import render_text
+except ImportError:  # run as a script, only the game's own directory is on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.text_cache import render_text
+
 try:
     from game_logic import Game
-    from constants import WHITE, RED
+    from game_loop import Snapshot
+    from constants import BLACK, WHITE, RED
 except ImportError:
     from .game_logic import Game
-    from .constants import WHITE, RED
+    from .game_loop import Snapshot
+    from .constants import BLACK, WHITE, RED
+
+
+class DirtyRectRenderer:
+    """Draws a game by only touching the parts of the screen that changed since the last frame
+
+    The border, net and scores are drawn onto a background surface, again only when a score changes. Each frame the
+    ball and paddles of the last frame are painted over with the background and drawn at their new place. draw returns
+    the rects to pass to pygame.display.update.
+    """
+
+    def __init__(self, screen: pygame.Surface, draw_offset_x: int = 0, draw_offset_y: int = 0):
+        self.screen = screen
+        self.draw_offset_x = draw_offset_x
+        self.draw_offset_y = draw_offset_y
+        self.background = pygame.Surface(screen.get_size())
+        self.scores: tuple[int, int] | None = None
+        self.moving_rects: list[pygame.Rect] = []
+        self.full_redraw = True
+
+    def invalidate(self):
+        # redraw everything next frame, e.g. after something else was drawn on the screen
+        self.full_redraw = True
+
+    def draw(self, game: Game, positions: Snapshot | None = None) -> list[pygame.Rect]:
+        scores = (game.score_left, game.score_right)
+        if scores != self.scores:
+            self.background.fill(BLACK)
+            draw_scores(self.background, game, self.draw_offset_x, self.draw_offset_y)
+            draw_net(self.background, game, self.draw_offset_x, self.draw_offset_y)
+            draw_border(self.background, game, self.draw_offset_x, self.draw_offset_y)
+            self.scores = scores
+            self.full_redraw = True
+
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+            dirty = [self.screen.get_rect()]
+            self.full_redraw = False
+        else:
+            dirty = self.moving_rects
+            for rect in dirty:
+                self.screen.blit(self.background, rect, rect)
+
+        self.moving_rects = draw_moving(self.screen, game, self.draw_offset_x, self.draw_offset_y, positions)
+        return dirty + self.moving_rects
+
+
+def draw_game(screen: pygame.Surface, game: Game, draw_offset_x: int = 0, draw_offset_y: int = 0, positions: Snapshot | None = None):
+    draw_border(screen, game, draw_offset_x, draw_offset_y)
+    draw_moving(screen, game, draw_offset_x, draw_offset_y, positions)
+
+
+def draw_border(screen: pygame.Surface, game: Game, draw_offset_x: int = 0, draw_offset_y: int = 0) -> pygame.Rect:
+    return pygame.draw.rect(screen, WHITE, (draw_offset_x, draw_offset_y, game.game_area.width, game.game_area.height), width=1)
 
 
-def draw_game(screen: pygame.Surface, game: Game, draw_offset_x: int = 0, draw_offset_y: int = 0):
-    pygame.draw.rect(screen, WHITE, (draw_offset_x, draw_offset_y, game.game_area.width, game.game_area.height), width=1)
-    pygame.draw.rect(screen, WHITE, (game.paddleR.x + draw_offset_x, game.paddleR.y + draw_offset_y, game.paddleR.width, game.paddleR.height))
-    pygame.draw.rect(screen, WHITE, (game.paddleL.x + draw_offset_x, game.paddleL.y + draw_offset_y, game.paddleL.width, game.paddleL.height))
-    pygame.draw.ellipse(screen, WHITE, (game.ball.x - game.ball.radius + draw_offset_x, game.ball.y - game.ball.radius + draw_offset_y, game.ball.radius * 2, game.ball.radius * 2))
+def draw_moving(screen: pygame.Surface, game: Game, draw_offset_x: int = 0, draw_offset_y: int = 0, positions: Snapshot | None = None) -> list[pygame.Rect]:
+    # positions, e.g. interpolated between two ticks, replace the current ones of the game
+    positions = positions or Snapshot.of(game)
+    return [
+        pygame.draw.rect(screen, WHITE, (game.paddleR.x + draw_offset_x, positions.paddle_right_y + draw_offset_y, game.paddleR.width, game.paddleR.height)),
+        pygame.draw.rect(screen, WHITE, (game.paddleL.x + draw_offset_x, positions.paddle_left_y + draw_offset_y, game.paddleL.width, game.paddleL.height)),
+        pygame.draw.ellipse(screen, WHITE, (positions.ball_x - game.ball.radius + draw_offset_x, positions.ball_y - game.ball.radius + draw_offset_y, game.ball.radius * 2, game.ball.radius * 2)),
+    ]
 
 
 def draw_net(screen: pygame.Surface, game: Game, draw_offset_x: int = 0, draw_offset_y: int = 0):
@@ -28,18 +95,16 @@ def draw_net(screen: pygame.Surface, game: Game, draw_offset_x: int = 0, draw_of
 
 
 def draw_scores(screen: pygame.Surface, game: Game, draw_offset_x: int = 0, draw_offset_y: int = 0):
-    font = pygame.font.SysFont("comicsans", 50)
-    left_score_txt = font.render(str(game.score_left), True, WHITE)
-    right_score_txt = font.render(str(game.score_right), True, WHITE)
+    left_score_txt = render_text(str(game.score_left), "comicsans", 50, WHITE)
+    right_score_txt = render_text(str(game.score_right), "comicsans", 50, WHITE)
     screen.blit(left_score_txt, (game.game_area.width // 4 - left_score_txt.get_width() // 2 - draw_offset_x, left_score_txt.get_height() // 2 - draw_offset_y))
     screen.blit(right_score_txt, (game.game_area.width * (3 / 4) - right_score_txt.get_width() // 2 - draw_offset_x, right_score_txt.get_height() // 2 - draw_offset_y))
 
 
 def draw_hits(screen: pygame.Surface, game: Game, draw_offset_x: int = 0, draw_offset_y: int = 0):
-    font = pygame.font.SysFont("comicsans", 30)
-    left_hits_txt = font.render(str(game.hits_left), True, RED)
-    right_hits_txt = font.render(str(game.hits_right), True, RED)
-    total_hits_txt = font.render(str(game.total_hits), True, RED)
+    left_hits_txt = render_text(str(game.hits_left), "comicsans", 30, RED)
+    right_hits_txt = render_text(str(game.hits_right), "comicsans", 30, RED)
+    total_hits_txt = render_text(str(game.total_hits), "comicsans", 30, RED)
 
     # Left hits at bottom middle left (1/4)
     screen.blit(left_hits_txt, (game.game_area.width // 4 - left_hits_txt.get_width() // 2 - draw_offset_x, game.game_area.height - left_hits_txt.get_height() - draw_offset_y))
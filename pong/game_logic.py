@@ -2,12 +2,19 @@ import math
 import random
 from dataclasses import dataclass
 
+try:
+    from collision import sweep_face
+except ImportError:
+    from .collision import sweep_face
+
 
 @dataclass
 class Game:
     WINNING_SCORE = 3
+    MAX_BOUNCES = 4  # most collisions handled within one tick
 
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, seed: int | str | None = None):
+        self.random = random.Random(seed)  # own generator so matches can be replayed from a seed
         self.game_area = GameArea(width, height)
         self.score_left = 0
         self.score_right = 0
@@ -49,8 +56,7 @@ class Game:
         return self.score_left >= self.WINNING_SCORE or self.score_right >= self.WINNING_SCORE
 
     def update(self):
-        self.ball.move()
-        self.handle_collisions()
+        self.move_ball()
         self.check_goal()
 
     def reset(self):
@@ -106,37 +112,58 @@ class Game:
         self.paddleR.x = self.game_area.width - self.paddleR.width - self.game_area.width * 0.05
         self.paddleR.y = self.game_area.height // 2 - self.paddleR.height // 2
 
-    def handle_collisions(self):
-
-        if self.ball.y + self.ball.radius >= self.game_area.height:
-            self.ball.y_velocity *= -1
-
-        if self.ball.y - self.ball.radius <= 0:
-            self.ball.y_velocity *= -1
-
-        if self.ball.x_velocity < 0:
-            if self.ball.y >= self.paddleL.y and self.ball.y <= self.paddleL.y + self.paddleL.height:
-                if self.ball.x - self.ball.radius <= self.paddleL.x + self.paddleL.width:
-                    self.ball.x_velocity *= -1
-                    self.hits_left += 1
-
-                    # Adjust ball velocity based on paddle position
-                    middle_y = self.paddleL.y + self.paddleL.height / 2
-                    y_difference = middle_y - self.ball.y
-                    reduction_factor = (self.paddleL.height / 2) / self.ball.MAX_VELOCITY
-                    self.ball.y_velocity = (y_difference / reduction_factor) * -1
-
-        if self.ball.x_velocity > 0:
-            if self.ball.y >= self.paddleR.y and self.ball.y <= self.paddleR.y + self.paddleR.height:
-                if self.ball.x + self.ball.radius >= self.paddleR.x:
-                    self.ball.x_velocity *= -1
-                    self.hits_right += 1
-
-                    # Adjust ball velocity based on paddle position
-                    middle_y = self.paddleR.y + self.paddleR.height / 2
-                    y_difference = middle_y - self.ball.y
-                    reduction_factor = (self.paddleR.height / 2) / self.ball.MAX_VELOCITY
-                    self.ball.y_velocity = (y_difference / reduction_factor) * -1
+    def move_ball(self):
+        """Move the ball one tick, bouncing it off walls and paddles at the exact time it touches them"""
+        remaining = 1.0
+        for _ in range(self.MAX_BOUNCES):
+            t, obstacle = self._next_collision(remaining)
+            if obstacle is None:
+                break
+            self.ball.move(t)
+            remaining -= t
+
+            if obstacle is self.paddleL:
+                self._bounce_off_paddle(self.paddleL)
+                self.hits_left += 1
+            elif obstacle is self.paddleR:
+                self._bounce_off_paddle(self.paddleR)
+                self.hits_right += 1
+            else:
+                self.ball.y_velocity *= -1
+
+        self.ball.move(remaining)
+
+    def _next_collision(self, remaining: float) -> tuple[float, object | None]:
+        # earliest wall or paddle the ball touches within the remaining part of the tick, the first listed wins a tie
+        ball = self.ball
+        candidates = []
+        if ball.y_velocity > 0:
+            candidates.append(((self.game_area.height - ball.radius - ball.y) / ball.y_velocity, "bottom"))
+        elif ball.y_velocity < 0:
+            candidates.append(((ball.radius - ball.y) / ball.y_velocity, "top"))
+        if ball.x_velocity < 0:
+            face_x, paddle = self.paddleL.x + self.paddleL.width, self.paddleL
+        else:
+            face_x, paddle = self.paddleR.x, self.paddleR
+        t = sweep_face(ball.x, ball.y, ball.x_velocity, ball.y_velocity, ball.radius, face_x, paddle.y, paddle.y + paddle.height, remaining)
+        if t is not None:
+            candidates.append((t, paddle))
+
+        best_t, best = remaining, None
+        for t, obstacle in candidates:
+            t = max(t, 0.0)  # a ball already past a wall bounces straight away
+            if t <= remaining and (best is None or t < best_t):
+                best_t, best = t, obstacle
+        return best_t, best
+
+    def _bounce_off_paddle(self, paddle: "Paddle"):
+        self.ball.x_velocity *= -1
+
+        # Adjust ball velocity based on paddle position, a ball caught by a corner bounces like one at the end
+        middle_y = paddle.y + paddle.height / 2
+        y_difference = middle_y - min(max(self.ball.y, paddle.y), paddle.y + paddle.height)
+        reduction_factor = (paddle.height / 2) / self.ball.MAX_VELOCITY
+        self.ball.y_velocity = (y_difference / reduction_factor) * -1
 
     def _set_ball_velocity(self):
         angle = self._get_random_angle(-30, 30, [0])
@@ -148,7 +175,7 @@ class Game:
     def _get_random_angle(self, min_angle: int, max_angle: int, excluded: list[int]) -> float:
         angle = 0
         while angle in excluded:
-            angle = math.radians(random.randrange(min_angle, max_angle))
+            angle = math.radians(self.random.randrange(min_angle, max_angle))
         return angle
 
 
@@ -178,7 +205,7 @@ class Paddle:
 
 @dataclass
 class Ball:
-    MAX_VELOCITY = 5
+    MAX_VELOCITY = 5  # collisions are swept, so a faster ball can't pass through a paddle, best.pickle was trained at 5
 
     def __init__(self, x: int, y: int, radius: int):
         self.x = x
@@ -187,6 +214,6 @@ class Ball:
         self.x_velocity = 0
         self.y_velocity = 0
 
-    def move(self):
-        self.x += self.x_velocity
-        self.y += self.y_velocity
+    def move(self, ticks: float = 1.0):
+        self.x += self.x_velocity * ticks
+        self.y += self.y_velocity * ticks
@@ -0,0 +1,73 @@
+"""Fixed timestep loop
+
+The windowed games advance the physics in ticks of 1 / FPS seconds of real time, however fast frames are rendered.
+FixedTimestep accumulates the elapsed time and hands it out as whole ticks, several per frame when rendering falls
+behind, and the fraction left over is used to interpolate the drawn positions between the last two ticks.
+"""
+
+import time
+from dataclasses import dataclass
+
+try:
+    from game_logic import Game
+    from constants import FPS, MAX_SUBSTEPS
+except ImportError:
+    from .game_logic import Game
+    from .constants import FPS, MAX_SUBSTEPS
+
+
+class FixedTimestep:
+
+    def __init__(self, tick_rate: int = FPS, max_substeps: int = MAX_SUBSTEPS):
+        self.tick_rate = tick_rate
+        self.max_substeps = max_substeps
+        self.accumulator = 0.0  # in ticks
+        self.last_time = time.perf_counter()
+
+    @property
+    def alpha(self) -> float:
+        """How far real time is between the last tick and the next one, from 0 to 1"""
+        return self.accumulator
+
+    def ticks(self) -> int:
+        """Number of physics ticks to run for the time elapsed since the last call"""
+        now = time.perf_counter()
+        self.accumulator += (now - self.last_time) * self.tick_rate
+        self.last_time = now
+
+        ticks = int(self.accumulator)
+        self.accumulator -= ticks
+        # drop the backlog of a long stall rather than trying to catch up on it
+        return min(ticks, self.max_substeps)
+
+    def reset(self):
+        # e.g. after pausing, so the pause isn't simulated
+        self.accumulator = 0.0
+        self.last_time = time.perf_counter()
+
+
+@dataclass
+class Snapshot:
+    """Positions of the moving objects of a game at one tick"""
+
+    ball_x: float
+    ball_y: float
+    paddle_left_y: float
+    paddle_right_y: float
+    goals: int
+
+    @classmethod
+    def of(cls, game: Game) -> "Snapshot":
+        return cls(game.ball.x, game.ball.y, game.paddleL.y, game.paddleR.y, game.score_left + game.score_right)
+
+    def interpolate(self, game: Game, alpha: float) -> "Snapshot":
+        current = Snapshot.of(game)
+        if current.goals != self.goals:  # the ball was reset, don't draw it flying back to the middle
+            return current
+        return Snapshot(
+            self.ball_x + (current.ball_x - self.ball_x) * alpha,
+            self.ball_y + (current.ball_y - self.ball_y) * alpha,
+            self.paddle_left_y + (current.paddle_left_y - self.paddle_left_y) * alpha,
+            self.paddle_right_y + (current.paddle_right_y - self.paddle_right_y) * alpha,
+            current.goals,
+        )
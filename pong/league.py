@@ -0,0 +1,81 @@
+"""Self-play league
+
+Playing every genome against every other one takes O(n²) matches a generation. In a league every genome plays a fixed
+number of opponents instead, O(n·k) matches: most are drawn from the population, preferring genomes of a similar Elo
+rating as those matches say the most about either side, and a few are past champions from the hall of fame, so the
+population can't forget how to beat strategies it has already moved away from.
+
+Ratings and the hall of fame live as long as the League does, they start over when a run is resumed from a checkpoint.
+"""
+
+import random
+from collections import deque
+
+import neat
+
+try:
+    from constants import LEAGUE_OPPONENTS, HALL_OF_FAME_OPPONENTS, HALL_OF_FAME_SIZE, INITIAL_RATING, ELO_K
+except ImportError:
+    from .constants import LEAGUE_OPPONENTS, HALL_OF_FAME_OPPONENTS, HALL_OF_FAME_SIZE, INITIAL_RATING, ELO_K
+
+
+class League:
+    """Evaluates a generation on matches against sampled opponents, play runs the matches like ai.play_matches"""
+
+    def __init__(
+        self,
+        play,
+        opponents: int = LEAGUE_OPPONENTS,
+        hall_of_fame_opponents: int = HALL_OF_FAME_OPPONENTS,
+        hall_of_fame_size: int = HALL_OF_FAME_SIZE,
+        k_factor: float = ELO_K,
+    ):
+        self.play = play
+        self.opponents = opponents
+        self.hall_of_fame_opponents = min(hall_of_fame_opponents, opponents)
+        self.k_factor = k_factor
+        self.ratings: dict[int, float] = {}  # by genome key
+        self.hall_of_fame: deque[neat.genome.DefaultGenome] = deque(maxlen=hall_of_fame_size)
+
+    def eval_genomes(self, genomes: list[tuple[int, neat.genome.DefaultGenome]], neat_config: neat.Config):
+        population = [genome for _, genome in genomes]
+        base_seed = random.randrange(2**32)
+        matches = [(genome, opponent) for genome in population for opponent in self._sample_opponents(genome, population)]
+        seeds = [f"{base_seed}:league:{n}" for n in range(len(matches))]
+        results = self.play(matches, neat_config, seeds)
+
+        # a genome is scored on the matches it plays as the left paddle, the same number for every genome
+        for genome in population:
+            genome.fitness = 0
+        for (genome, opponent), (fitness1, fitness2) in zip(matches, results):
+            genome.fitness += fitness1
+            self._update_ratings(genome, opponent, 1.0 if fitness1 > fitness2 else 0.0 if fitness1 < fitness2 else 0.5)
+
+        champion = max(population, key=lambda genome: genome.fitness)
+        if all(genome.key != champion.key for genome in self.hall_of_fame):
+            self.hall_of_fame.append(champion)
+
+        keep = {genome.key for genome in population} | {genome.key for genome in self.hall_of_fame}
+        self.ratings = {key: rating for key, rating in self.ratings.items() if key in keep}
+
+    def rating(self, genome: neat.genome.DefaultGenome) -> float:
+        return self.ratings.get(genome.key, INITIAL_RATING)
+
+    def _sample_opponents(self, genome: neat.genome.DefaultGenome, population: list[neat.genome.DefaultGenome]) -> list[neat.genome.DefaultGenome]:
+        champions = [champion for champion in self.hall_of_fame if champion.key != genome.key]
+        from_hall = random.choices(champions, k=self.hall_of_fame_opponents) if champions else []
+
+        others = [other for other in population if other is not genome] or [genome]
+        # E (1 - E) is largest for an even match and falls off quickly as the ratings drift apart
+        weights = [expected * (1 - expected) for expected in (self._expected_score(genome, other) for other in others)]
+        return from_hall + random.choices(others, weights, k=self.opponents - len(from_hall))
+
+    def _expected_score(self, genome: neat.genome.DefaultGenome, opponent: neat.genome.DefaultGenome) -> float:
+        return 1 / (1 + 10 ** ((self.rating(opponent) - self.rating(genome)) / 400))
+
+    def _update_ratings(self, genome: neat.genome.DefaultGenome, opponent: neat.genome.DefaultGenome, score: float):
+        if genome.key == opponent.key:
+            return
+        change = self.k_factor * (score - self._expected_score(genome, opponent))
+        self.ratings[genome.key] = self.rating(genome) + change
+        self.ratings[opponent.key] = self.rating(opponent) - change
@@ -0,0 +1,61 @@
+"""Closed-form ball trajectory
+
+Between collisions the ball flies in a straight line, so where it will be can be computed instead of simulated tick by
+tick. Bounces off the top and bottom walls are folded in by reflecting the unbounded trajectory back into the field.
+"""
+
+import math
+
+try:
+    from game_logic import Game
+    from collision import sweep_face
+except ImportError:
+    from .game_logic import Game
+    from .collision import sweep_face
+
+
+def intercept(game: Game, plane_x: float) -> tuple[float, float] | None:
+    """Ticks until the ball's center reaches x = plane_x and its y there, bouncing off the walls; None if it flies away"""
+    ball = game.ball
+    if ball.x_velocity == 0 or (plane_x - ball.x) / ball.x_velocity < 0:
+        return None
+    ticks = (plane_x - ball.x) / ball.x_velocity
+    return ticks, fold(ball.y + ball.y_velocity * ticks, ball.radius, game.game_area.height - ball.radius)
+
+
+def fold(y: float, low: float, high: float) -> float:
+    """Reflect a y of the unbounded trajectory back between low and high, once for every wall it bounced off"""
+    span = high - low
+    if span <= 0:
+        return low
+    offset = (y - low) % (2 * span)
+    return low + (offset if offset <= span else 2 * span - offset)
+
+
+def collision_free_ticks(game: Game) -> int:
+    """Whole ticks the ball flies straight ahead without touching a wall or a paddle or going out, with one spare tick
+
+    The paddles are taken to stay where they are.
+    """
+    ball = game.ball
+    times = [math.inf]
+    if ball.y_velocity > 0:
+        times.append((game.game_area.height - ball.radius - ball.y) / ball.y_velocity)
+    elif ball.y_velocity < 0:
+        times.append((ball.radius - ball.y) / ball.y_velocity)
+
+    if ball.x_velocity < 0:
+        face_x, paddle, goal_x = game.paddleL.x + game.paddleL.width, game.paddleL, 0
+    else:
+        face_x, paddle, goal_x = game.paddleR.x, game.paddleR, game.game_area.width
+    t = sweep_face(ball.x, ball.y, ball.x_velocity, ball.y_velocity, ball.radius, face_x, paddle.y, paddle.y + paddle.height, math.inf)
+    if t is not None:
+        times.append(t)
+    if ball.x_velocity != 0:
+        times.append((goal_x - ball.x) / ball.x_velocity)
+
+    t = min(times)
+    if math.isinf(t):
+        return 0
+    # the ball's position is summed up tick by tick, the spare tick covers the rounding of that sum
+    return max(math.floor(t) - 1, 0)
@@ -1,7 +1,14 @@
+import os
 import sys
 import logging
 import pygame
 
+try:
+    from common.text_cache import render_text
+except ImportError:  # run as a script, only the game's own directory is on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.text_cache import render_text
+
 try:
     from .game_logic import Game, Grid
     from .ai import SnakeAI
@@ -56,12 +63,9 @@ def main():
 
 def show_welcome_screen(screen: pygame.Surface):
     screen.fill(BLACK)
-    font_50 = pygame.font.SysFont("arial", 50)
-    font_40 = pygame.font.SysFont("arial", 40)
-
-    title = font_50.render(TITLE, True, GREEN)
-    human_text = font_40.render("Press H for Human Player", True, GREY)
-    ai_text = font_40.render("Press A for AI Player", True, GREY)
+    title = render_text(TITLE, "arial", 50, GREEN)
+    human_text = render_text("Press H for Human Player", "arial", 40, GREY)
+    ai_text = render_text("Press A for AI Player", "arial", 40, GREY)
 
     title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 3))
     human_rect = human_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
@@ -75,8 +79,7 @@ def show_welcome_screen(screen: pygame.Surface):
 
 
 def show_game_over(screen: pygame.Surface, game: Game):
-    font = pygame.font.SysFont("arial", 50)
-    game_over_text = font.render(f"Game Over! Score: {game.score}", True, RED)
+    game_over_text = render_text(f"Game Over! Score: {game.score}", "arial", 50, RED)
     text_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
     screen.blit(game_over_text, text_rect)
     pygame.display.flip()
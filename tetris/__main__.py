@@ -1,7 +1,14 @@
+import os
 import sys
 import random
 import pygame
 
+try:
+    from common.text_cache import render_text
+except ImportError:  # run as a script, only the game's own directory is on the path
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.text_cache import render_text
+
 try:
     from .game_objects import Piece
     from .constants import (
@@ -318,16 +325,14 @@ def clear_rows(grid, locked):
 
 
 def draw_text_middle(surface, text, color):
-    FONT_60_CS = pygame.font.SysFont("comicsans", 60, bold=True)
-    label = FONT_60_CS.render(text, 1, color)
+    label = render_text(text, "comicsans", 60, color, bold=True)
     surface.blit(label, (SCREEN_WIDTH / 2 - (label.get_width() / 2), SCREEN_HEIGHT / 2 - (label.get_height() / 2)))
 
 
 def draw_score(surface, score, level, high_score=0):
-    FONT_28_CS = pygame.font.SysFont("comicsans", 28)
-    label_score = FONT_28_CS.render(f"Score: {score}", 1, WHITE)
-    label_level = FONT_28_CS.render(f"Level: {level}", 1, WHITE)
-    label_high_score = FONT_28_CS.render(f"High Score: {high_score}", 1, WHITE)
+    label_score = render_text(f"Score: {score}", "comicsans", 28, WHITE)
+    label_level = render_text(f"Level: {level}", "comicsans", 28, WHITE)
+    label_high_score = render_text(f"High Score: {high_score}", "comicsans", 28, WHITE)
 
     # Position for score display - left side of the screen
     score_x = 30